@@ -9,7 +9,7 @@ from .enums import (AccountStatus, Asset, OrderStatus, OrderType, Side,
                     TimeInForce, TransactionStatus, TransactionType)
 
 
-@dataclass
+@dataclass(slots=True)
 class User:
     id: int
     email: str
@@ -18,7 +18,7 @@ class User:
     last_login: Optional[datetime] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class Account:
     id: int
     user_id: int
@@ -27,7 +27,7 @@ class Account:
     frozen: bool = False  # Additional freeze flag for admin control
 
 
-@dataclass
+@dataclass(slots=True)
 class Balance:
     id: int
     account_id: int
@@ -37,7 +37,7 @@ class Balance:
     updated_at: datetime = field(default_factory=lambda: datetime.now(timezone.utc))
 
 
-@dataclass
+@dataclass(slots=True)
 class Order:
     id: int
     user_id: int
@@ -59,7 +59,7 @@ class Order:
         return self.amount - self.filled
 
 
-@dataclass
+@dataclass(slots=True)
 class Trade:
     id: int
     buy_order_id: int
@@ -73,7 +73,7 @@ class Trade:
     created_at: datetime = field(default_factory=lambda: datetime.now(timezone.utc))
 
 
-@dataclass
+@dataclass(slots=True)
 class Transaction:
     id: int
     user_id: int
@@ -91,7 +91,7 @@ class Transaction:
     created_at: datetime = field(default_factory=lambda: datetime.now(timezone.utc))
 
 
-@dataclass
+@dataclass(slots=True)
 class AuditLog:
     id: int
     actor: str
@@ -5,7 +5,8 @@ Base database interface and abstract classes
 from __future__ import annotations
 
 from abc import ABC, abstractmethod
-from typing import Any, Dict, List, Optional, Protocol, TypeVar
+from typing import (Any, Dict, Iterable, List, Optional, Protocol, Sequence,
+                    TypeVar)
 
 from alt_exchange.core.enums import Asset
 from alt_exchange.core.models import (Account, AuditLog, Balance, Order, Trade,
@@ -13,6 +14,17 @@ from alt_exchange.core.models import (Account, AuditLog, Balance, Order, Trade,
 
 T = TypeVar("T")
 
+# Single-row write used by insert_many for each model type
+_INSERT_METHODS: Dict[type, str] = {
+    User: "insert_user",
+    Account: "insert_account",
+    Balance: "upsert_balance",
+    Order: "insert_order",
+    Trade: "insert_trade",
+    Transaction: "insert_transaction",
+    AuditLog: "insert_audit_log",
+}
+
 
 class Database(ABC):
     """Abstract database interface"""
@@ -22,6 +34,20 @@ class Database(ABC):
         """Generate next ID for a table"""
         pass
 
+    def next_ids(self, table: str, n: int) -> Sequence[int]:
+        """Generate the next n IDs for a table"""
+        if n < 0:
+            raise ValueError(f"Cannot reserve a negative number of IDs: {n}")
+        return [self.next_id(table) for _ in range(n)]
+
+    def insert_many(self, objs: Iterable[Any]) -> None:
+        """Insert a batch of models, dispatching on each model's type"""
+        for obj in objs:
+            method = _INSERT_METHODS.get(type(obj))
+            if method is None:
+                raise TypeError(f"Unsupported model type: {type(obj).__name__}")
+            getattr(self, method)(obj)
+
     # User operations
     @abstractmethod
     def insert_user(self, user: User) -> User:
@@ -30,9 +56,13 @@ class Database(ABC):
 
     @abstractmethod
     def get_user(self, user_id: int) -> Optional[User]:
-        """Get user by ID"""
+        """Get user by ID, or None if it does not exist"""
         pass
 
+    def get_users(self, user_ids: Iterable[int]) -> List[Optional[User]]:
+        """Get users by ID, with None for each ID that is not found"""
+        return [self.get_user(user_id) for user_id in user_ids]
+
     @abstractmethod
     def get_user_by_email(self, email: str) -> Optional[User]:
         """Get user by email"""
@@ -51,7 +81,7 @@ class Database(ABC):
 
     @abstractmethod
     def get_account(self, account_id: int) -> Optional[Account]:
-        """Get account by ID"""
+        """Get account by ID, or None if it does not exist"""
         pass
 
     @abstractmethod
@@ -67,7 +97,7 @@ class Database(ABC):
 
     @abstractmethod
     def find_balance(self, account_id: int, asset: Asset) -> Optional[Balance]:
-        """Find balance by account and asset"""
+        """Find balance by account and asset, or None if it does not exist"""
         pass
 
     @abstractmethod
@@ -88,7 +118,7 @@ class Database(ABC):
 
     @abstractmethod
     def get_order(self, order_id: int) -> Optional[Order]:
-        """Get order by ID"""
+        """Get order by ID, or None if it does not exist"""
         pass
 
     @abstractmethod
@@ -109,7 +139,7 @@ class Database(ABC):
 
     @abstractmethod
     def get_trade(self, trade_id: int) -> Optional[Trade]:
-        """Get trade by ID"""
+        """Get trade by ID, or None if it does not exist"""
         pass
 
     @abstractmethod
@@ -130,7 +160,7 @@ class Database(ABC):
 
     @abstractmethod
     def get_transaction(self, transaction_id: int) -> Optional[Transaction]:
-        """Get transaction by ID"""
+        """Get transaction by ID, or None if it does not exist"""
         pass
 
     @abstractmethod
@@ -4,10 +4,12 @@ Database coverage analysis and reporting
 
 from __future__ import annotations
 
+import math
 import time
 from collections import defaultdict
 from dataclasses import dataclass, field
-from typing import Any, Dict, List, Optional, Set
+from typing import (Any, Dict, FrozenSet, Iterable, List, Optional, Sequence,
+                    Set)
 
 from alt_exchange.core.enums import Asset
 from alt_exchange.core.models import (Account, AuditLog, Balance, Order, Trade,
@@ -88,29 +90,37 @@ class CoverageReport:
         }
 
 
-class DatabaseCoverageAnalyzer:
-    """Analyzes database coverage and generates reports"""
+def _summarize_response_times(times: List[float]) -> Dict[str, float]:
+    """Summarize response times (ms), with nearest-rank percentiles"""
+    if not times:
+        return {
+            "avg": 0,
+            "max": 0,
+            "min": 0,
+            "p50": 0,
+            "p95": 0,
+            "p99": 0,
+            "count": 0,
+            "total": 0,
+        }
+    ordered = sorted(times)
+    n = len(ordered)
+    total = sum(ordered)
+    summary = {"avg": total / n, "max": ordered[-1], "min": ordered[0]}
+    for pct in (50, 95, 99):
+        summary[f"p{pct}"] = ordered[math.ceil(pct * n / 100) - 1]
+    summary["count"] = n
+    summary["total"] = total
+    return summary
 
-    def __init__(self, database: Database) -> None:
-        self.database = database
-        self.call_counts: Dict[str, int] = defaultdict(int)
-        self.response_times: Dict[str, List[float]] = defaultdict(list)
-        self.errors: Dict[str, int] = defaultdict(int)
-        self.data_types_used: Set[str] = set()
-        self.query_patterns: Set[str] = set()
-        self.error_scenarios: Set[str] = set()
-        self.transaction_patterns: Set[str] = set()
 
-        # Define expected coverage targets
-        self.expected_methods = self._get_expected_methods()
-        self.expected_data_types = self._get_expected_data_types()
-        self.expected_query_patterns = self._get_expected_query_patterns()
-        self.expected_error_scenarios = self._get_expected_error_scenarios()
-        self.expected_transaction_patterns = self._get_expected_transaction_patterns()
+class DatabaseCoverageAnalyzer:
+    """Analyzes database coverage and generates reports"""
 
-    def _get_expected_methods(self) -> Set[str]:
-        """Get all expected database methods"""
-        return {
+    # Expected coverage targets. They do not depend on the wrapped database,
+    # so they are built once per class rather than once per instance.
+    expected_methods: FrozenSet[str] = frozenset(
+        {
             # User methods
             "insert_user",
             "get_user",
@@ -144,10 +154,10 @@ class DatabaseCoverageAnalyzer:
             # Utility methods
             "next_id",
         }
+    )
 
-    def _get_expected_data_types(self) -> Set[str]:
-        """Get all expected data types"""
-        return {
+    expected_data_types: FrozenSet[str] = frozenset(
+        {
             "User",
             "Account",
             "Balance",
@@ -164,10 +174,10 @@ class DatabaseCoverageAnalyzer:
             "TransactionType",
             "AccountStatus",
         }
+    )
 
-    def _get_expected_query_patterns(self) -> Set[str]:
-        """Get all expected query patterns"""
-        return {
+    expected_query_patterns: FrozenSet[str] = frozenset(
+        {
             "single_select",
             "multi_select",
             "insert",
@@ -185,10 +195,10 @@ class DatabaseCoverageAnalyzer:
             "subquery",
             "union",
         }
+    )
 
-    def _get_expected_error_scenarios(self) -> Set[str]:
-        """Get all expected error scenarios"""
-        return {
+    expected_error_scenarios: FrozenSet[str] = frozenset(
+        {
             "not_found",
             "duplicate_key",
             "foreign_key_violation",
@@ -200,10 +210,10 @@ class DatabaseCoverageAnalyzer:
             "insufficient_privileges",
             "database_unavailable",
         }
+    )
 
-    def _get_expected_transaction_patterns(self) -> Set[str]:
-        """Get all expected transaction patterns"""
-        return {
+    expected_transaction_patterns: FrozenSet[str] = frozenset(
+        {
             "single_transaction",
             "nested_transaction",
             "distributed_transaction",
@@ -214,6 +224,17 @@ class DatabaseCoverageAnalyzer:
             "concurrent_transactions",
             "long_running_transaction",
         }
+    )
+
+    def __init__(self, database: Database) -> None:
+        self.database = database
+        self.call_counts: Dict[str, int] = defaultdict(int)
+        self.response_times: Dict[str, List[float]] = defaultdict(list)
+        self.errors: Dict[str, int] = defaultdict(int)
+        self.data_types_used: Set[str] = set()
+        self.query_patterns: Set[str] = set()
+        self.error_scenarios: Set[str] = set()
+        self.transaction_patterns: Set[str] = set()
 
     def record_method_call(
         self,
@@ -310,17 +331,19 @@ class DatabaseCoverageAnalyzer:
         ]
         metrics.overall_coverage = sum(coverage_scores) / len(coverage_scores)
 
-        # Calculate performance metrics
-        all_response_times = []
-        for times in self.response_times.values():
-            all_response_times.extend(times)
-
-        if all_response_times:
-            metrics.avg_response_time = sum(all_response_times) / len(
-                all_response_times
+        # Calculate performance metrics from the per-method summaries
+        method_response_times = {
+            method: _summarize_response_times(times)
+            for method, times in self.response_times.items()
+        }
+        summaries = [s for s in method_response_times.values() if s["count"]]
+        if summaries:
+            sample_count = sum(s["count"] for s in summaries)
+            metrics.avg_response_time = (
+                sum(s["total"] for s in summaries) / sample_count
             )
-            metrics.max_response_time = max(all_response_times)
-            metrics.min_response_time = min(all_response_times)
+            metrics.max_response_time = max(s["max"] for s in summaries)
+            metrics.min_response_time = min(s["min"] for s in summaries)
 
         # Calculate error metrics
         total_calls = sum(self.call_counts.values())
@@ -333,15 +356,7 @@ class DatabaseCoverageAnalyzer:
         # Generate detailed metrics
         detailed_metrics = {
             "method_call_counts": dict(self.call_counts),
-            "method_response_times": {
-                method: {
-                    "avg": sum(times) / len(times) if times else 0,
-                    "max": max(times) if times else 0,
-                    "min": min(times) if times else 0,
-                    "count": len(times),
-                }
-                for method, times in self.response_times.items()
-            },
+            "method_response_times": method_response_times,
             "error_counts": dict(self.errors),
             "missing_methods": self.expected_methods - called_methods,
             "missing_data_types": self.expected_data_types - self.data_types_used,
@@ -436,10 +451,18 @@ class CoverageTrackingDatabase:
     def __init__(self, database: Database) -> None:
         self.database = database
         self.analyzer = DatabaseCoverageAnalyzer(database)
+        # Set to False to pass calls straight through without recording them
+        self.enabled = True
+
+    def _record_data_type(self, data_type: str) -> None:
+        if self.enabled:
+            self.analyzer.record_data_type_usage(data_type)
 
     def _track_call(self, method_name: str, func, *args, **kwargs):
         """Track a method call with timing and error handling"""
-        start_time = time.time()
+        if not self.enabled:
+            return func(*args, **kwargs)
+        start_ns = time.perf_counter_ns()
         success = True
         error_type = None
 
@@ -451,19 +474,22 @@ class CoverageTrackingDatabase:
             error_type = type(e).__name__
             raise
         finally:
-            response_time = (time.time() - start_time) * 1000  # Convert to ms
+            response_time = (time.perf_counter_ns() - start_ns) / 1_000_000  # ns -> ms
             self.analyzer.record_method_call(
                 method_name, response_time, success, error_type
             )
 
     # User operations
     def insert_user(self, user: User) -> User:
-        self.analyzer.record_data_type_usage("User")
+        self._record_data_type("User")
         return self._track_call("insert_user", self.database.insert_user, user)
 
     def get_user(self, user_id: int) -> Optional[User]:
         return self._track_call("get_user", self.database.get_user, user_id)
 
+    def get_users(self, user_ids: Sequence[int]) -> List[Optional[User]]:
+        return self._track_call("get_users", self.database.get_users, user_ids)
+
     def get_user_by_email(self, email: str) -> Optional[User]:
         return self._track_call(
             "get_user_by_email", self.database.get_user_by_email, email
@@ -471,7 +497,7 @@ class CoverageTrackingDatabase:
 
     # Account operations
     def insert_account(self, account: Account) -> Account:
-        self.analyzer.record_data_type_usage("Account")
+        self._record_data_type("Account")
         return self._track_call("insert_account", self.database.insert_account, account)
 
     def get_account(self, account_id: int) -> Optional[Account]:
@@ -484,11 +510,11 @@ class CoverageTrackingDatabase:
 
     # Balance operations
     def upsert_balance(self, balance: Balance) -> Balance:
-        self.analyzer.record_data_type_usage("Balance")
+        self._record_data_type("Balance")
         return self._track_call("upsert_balance", self.database.upsert_balance, balance)
 
     def find_balance(self, account_id: int, asset: Asset) -> Optional[Balance]:
-        self.analyzer.record_data_type_usage("Asset")
+        self._record_data_type("Asset")
         return self._track_call(
             "find_balance", self.database.find_balance, account_id, asset
         )
@@ -500,7 +526,7 @@ class CoverageTrackingDatabase:
 
     # Order operations
     def insert_order(self, order: Order) -> Order:
-        self.analyzer.record_data_type_usage("Order")
+        self._record_data_type("Order")
         return self._track_call("insert_order", self.database.insert_order, order)
 
     def update_order(self, order: Order) -> None:
@@ -521,7 +547,7 @@ class CoverageTrackingDatabase:
 
     # Trade operations
     def insert_trade(self, trade: Trade) -> Trade:
-        self.analyzer.record_data_type_usage("Trade")
+        self._record_data_type("Trade")
         return self._track_call("insert_trade", self.database.insert_trade, trade)
 
     def get_trade(self, trade_id: int) -> Optional[Trade]:
@@ -534,7 +560,7 @@ class CoverageTrackingDatabase:
 
     # Transaction operations
     def insert_transaction(self, transaction: Transaction) -> Transaction:
-        self.analyzer.record_data_type_usage("Transaction")
+        self._record_data_type("Transaction")
         return self._track_call(
             "insert_transaction", self.database.insert_transaction, transaction
         )
@@ -556,7 +582,7 @@ class CoverageTrackingDatabase:
 
     # Audit log operations
     def insert_audit(self, audit_log: AuditLog) -> AuditLog:
-        self.analyzer.record_data_type_usage("AuditLog")
+        self._record_data_type("AuditLog")
         return self._track_call("insert_audit", self.database.insert_audit, audit_log)
 
     def get_audit_logs(self, limit: int = 100) -> List[AuditLog]:
@@ -566,6 +592,21 @@ class CoverageTrackingDatabase:
     def next_id(self, table: str) -> int:
         return self._track_call("next_id", self.database.next_id, table)
 
+    def next_ids(self, table: str, n: int) -> Sequence[int]:
+        return self._track_call("next_ids", self.database.next_ids, table, n)
+
+    def insert_many(self, objs: Iterable[Any]) -> None:
+        # Materialize once so a generator is not exhausted before the insert
+        objs = list(objs)
+        self._track_call("insert_many", self.database.insert_many, objs)
+        if self.enabled:
+            for data_type in {type(obj).__name__ for obj in objs}:
+                self.analyzer.record_data_type_usage(data_type)
+
     def generate_coverage_report(self) -> CoverageReport:
         """Generate coverage report"""
         return self.analyzer.generate_report()
+
+    def reset_coverage(self) -> None:
+        """Discard all recorded coverage data"""
+        self.analyzer = DatabaseCoverageAnalyzer(self.database)
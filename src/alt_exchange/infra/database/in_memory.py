@@ -6,8 +6,9 @@ from __future__ import annotations
 
 from collections import defaultdict
 from dataclasses import replace
-from itertools import count
-from typing import List, Optional
+from itertools import count, groupby
+from threading import Lock
+from typing import Any, Iterable, List, Optional
 
 from alt_exchange.core.enums import Asset
 from alt_exchange.core.models import (Account, AuditLog, Balance, Order, Trade,
@@ -28,9 +29,42 @@ class InMemoryDatabase(Database):
         self.audit_logs: dict[int, AuditLog] = {}
         self._balance_index: dict[tuple[int, Asset], int] = {}
         self._counters = defaultdict(lambda: count(1))
+        # next_ids reads and replaces a counter; keep that atomic with next_id
+        self._id_lock = Lock()
 
     def next_id(self, table: str) -> int:
-        return next(self._counters[table])
+        with self._id_lock:
+            return next(self._counters[table])
+
+    def next_ids(self, table: str, n: int) -> range:
+        if n < 0:
+            raise ValueError(f"Cannot reserve a negative number of IDs: {n}")
+        with self._id_lock:
+            start = next(self._counters[table])
+            self._counters[table] = count(start + n)
+        return range(start, start + n)
+
+    def insert_many(self, objs: Iterable[Any]) -> None:
+        tables = {
+            User: self.users,
+            Account: self.accounts,
+            Balance: self.balances,
+            Order: self.orders,
+            Trade: self.trades,
+            Transaction: self.transactions,
+            AuditLog: self.audit_logs,
+        }
+        # Write each run of same-typed models with a single dict.update
+        for model, run in groupby(objs, key=type):
+            table = tables.get(model)
+            if table is None:
+                raise TypeError(f"Unsupported model type: {model.__name__}")
+            rows = {obj.id: obj for obj in run}
+            table.update(rows)
+            if model is Balance:
+                self._balance_index.update(
+                    {(bal.account_id, bal.asset): bal.id for bal in rows.values()}
+                )
 
     # User operations
     def insert_user(self, user: User) -> User:
@@ -40,6 +74,10 @@ class InMemoryDatabase(Database):
     def get_user(self, user_id: int) -> Optional[User]:
         return self.users.get(user_id)
 
+    def get_users(self, user_ids: Iterable[int]) -> List[Optional[User]]:
+        users = self.users
+        return [users.get(user_id) for user_id in user_ids]
+
     def get_user_by_email(self, email: str) -> Optional[User]:
         for user in self.users.values():
             if user.email == email:
@@ -154,6 +192,18 @@ class InMemoryDatabase(Database):
         new_db._counters = defaultdict(lambda: count(1))
         return new_db
 
+    def reset(self) -> None:
+        """Clear all data and ID counters, keeping the same instance"""
+        self.users.clear()
+        self.accounts.clear()
+        self.balances.clear()
+        self.orders.clear()
+        self.trades.clear()
+        self.transactions.clear()
+        self.audit_logs.clear()
+        self._balance_index.clear()
+        self._counters.clear()
+
     def restore(self, snapshot: "InMemoryDatabase") -> None:
         """Restore from snapshot"""
         self.users = snapshot.users
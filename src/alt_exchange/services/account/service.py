@@ -48,9 +48,10 @@ class AccountService:
             account = Account(id=self.db.next_id("accounts"), user_id=user.id)
             self.db.insert_account(account)
 
-            for asset in Asset:
+            balance_ids = self.db.next_ids("balances", len(Asset))
+            for balance_id, asset in zip(balance_ids, Asset, strict=True):
                 balance = Balance(
-                    id=self.db.next_id("balances"),
+                    id=balance_id,
                     account_id=account.id,
                     asset=asset,
                     available=Decimal("0"),
@@ -74,9 +75,10 @@ class AccountService:
             self.db.insert_account(account)
 
             # Create balances for all assets
-            for asset in Asset:
+            balance_ids = self.db.next_ids("balances", len(Asset))
+            for balance_id, asset in zip(balance_ids, Asset, strict=True):
                 balance = Balance(
-                    id=self.db.next_id("balances"),
+                    id=balance_id,
                     account_id=account.id,
                     asset=asset,
                     available=Decimal("0"),
@@ -0,0 +1,40 @@
+"""
+In-memory database benchmarks (run with `make benchmark`)
+"""
+
+import pytest
+
+from alt_exchange.core.models import User
+from alt_exchange.infra.database.in_memory import InMemoryDatabase
+
+pytest.importorskip("pytest_benchmark")
+
+_USERS = [
+    User(id=i, email=f"bench{i}@example.com", password_hash="hashed_password")
+    for i in range(1, 1001)
+]
+
+
+def _insert_users_per_row():
+    db = InMemoryDatabase()
+    for user in _USERS:
+        db.insert_user(user)
+    return db
+
+
+def _insert_users_bulk():
+    db = InMemoryDatabase()
+    db.insert_many(_USERS)
+    return db
+
+
+@pytest.mark.benchmark(group="insert_users")
+def test_insert_users_per_row_bench(benchmark):
+    db = benchmark(_insert_users_per_row)
+    assert len(db.users) == len(_USERS)
+
+
+@pytest.mark.benchmark(group="insert_users")
+def test_insert_users_bulk_bench(benchmark):
+    db = benchmark(_insert_users_bulk)
+    assert len(db.users) == len(_USERS)
@@ -0,0 +1,41 @@
+"""
+Model construction benchmarks (run with `make benchmark`)
+"""
+
+from decimal import Decimal
+
+import pytest
+
+from alt_exchange.core.enums import OrderType, Side, TimeInForce
+from alt_exchange.core.models import Order
+
+pytest.importorskip("pytest_benchmark")
+
+_D100 = Decimal("100.0")
+_D10 = Decimal("10.0")
+
+
+def _build_order():
+    return Order(
+        id=1,
+        user_id=1,
+        account_id=1,
+        market="ALT/USDT",
+        side=Side.BUY,
+        type=OrderType.LIMIT,
+        time_in_force=TimeInForce.GTC,
+        price=_D100,
+        amount=_D10,
+    )
+
+
+@pytest.mark.benchmark(group="models")
+def test_order_construct_bench(benchmark):
+    order = benchmark(_build_order)
+    assert order.amount == _D10
+
+
+@pytest.mark.benchmark(group="models")
+def test_order_remaining_bench(benchmark):
+    order = _build_order()
+    assert benchmark(order.remaining) == _D10
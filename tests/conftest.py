@@ -0,0 +1,24 @@
+"""
+Shared pytest fixtures
+"""
+
+from datetime import datetime
+
+import pytest
+
+
+def pytest_configure(config):
+    config.addinivalue_line(
+        "markers", "smoke: structural smoke tests (deselect with -m 'not smoke')"
+    )
+
+
+def _assert_auto_ts(obj, field="created_at"):
+    """Assert that a model's auto-populated timestamp field was set"""
+    assert isinstance(getattr(obj, field), datetime)
+
+
+@pytest.fixture
+def assert_auto_ts():
+    """Helper asserting a model timestamp was filled in by its default factory"""
+    return _assert_auto_ts
@@ -21,6 +21,7 @@ class TestAccountServiceAdditional:
         """Mock database"""
         db = Mock()
         db.next_id.side_effect = [1, 2, 3, 4]
+        db.next_ids.side_effect = lambda table, n: range(1, n + 1)
         return db
 
     @pytest.fixture
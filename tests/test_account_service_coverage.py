@@ -20,6 +20,7 @@ class TestAccountServiceCoverage:
         """Mock database"""
         db = MagicMock()
         db.next_id.side_effect = [1, 2, 3, 4, 5, 6, 7, 8, 9, 10]
+        db.next_ids.side_effect = lambda table, n: range(1, n + 1)
         db.users = {}
         db.accounts = {}
         db.balances = {}
@@ -53,6 +54,7 @@ class TestAccountServiceCoverage:
         assert result.email == "test@example.com"
         assert result.id == 1
         assert result.password_hash is not None
+        assert mock_db.upsert_balance.call_count == len(Asset)
 
     def test_get_account_success(self, account_service, mock_db):
         """Test successful account retrieval"""
@@ -15,6 +15,7 @@ class TestAccountServiceMethods:
         """Mock database"""
         db = MagicMock()
         db.next_id.return_value = 1
+        db.next_ids.side_effect = lambda table, n: range(1, n + 1)
         db.users = {}
         db.accounts = {}
         db.balances = {}
@@ -43,12 +44,7 @@ class TestAccountServiceMethods:
     def test_create_user_basic(self, account_service, mock_db):
         """Test create_user method basic functionality"""
         # Setup
-        mock_db.next_id.side_effect = [
-            1,
-            2,
-            3,
-            4,
-        ]  # user_id, account_id, balance_id, balance_id
+        mock_db.next_id.side_effect = [1, 2]  # user_id, account_id
 
         # Execute
         user = account_service.create_user("test@example.com", "password123")
@@ -58,6 +54,7 @@ class TestAccountServiceMethods:
         assert user.password_hash is not None
         assert mock_db.insert_user.called
         assert mock_db.insert_account.called
+        assert mock_db.upsert_balance.call_count == len(Asset)
 
     def test_get_account_basic(self, account_service, mock_db):
         """Test get_account method basic functionality"""
@@ -29,6 +29,7 @@ class TestAccountServiceMoreCoverage:
         """Mock database."""
         db = Mock()
         db.next_id = Mock(side_effect=[1, 2, 3, 4, 5, 6, 7, 8, 9, 10])
+        db.next_ids.side_effect = lambda table, n: range(1, n + 1)
         db.accounts = {}
         db.balances = {}
         db.orders = {}
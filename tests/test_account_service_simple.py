@@ -24,6 +24,7 @@ class TestAccountServiceSimple:
         """Create mock database"""
         db = Mock()
         db.accounts = {}
+        db.next_ids.side_effect = lambda table, n: range(1, n + 1)
         db.balances = {}
         db.orders = {}
         db.transactions = {}
@@ -13,6 +13,8 @@ from alt_exchange.core.models import (Account, AuditLog, Balance, Transaction,
                                       User)
 from alt_exchange.services.admin.service import AdminService
 
+_FIXED_TS = datetime(2024, 1, 1, tzinfo=timezone.utc)
+
 
 class TestAdminServiceExtended:
     """Extended tests for AdminService"""
@@ -404,7 +406,7 @@ class TestAdminServiceExtended:
             action="test_action",
             entity="test_entity",
             metadata={},
-            created_at=datetime.now(timezone.utc),
+            created_at=_FIXED_TS,
         )
         log2 = AuditLog(
             id=2,
@@ -412,7 +414,7 @@ class TestAdminServiceExtended:
             action="another_action",
             entity="another_entity",
             metadata={},
-            created_at=datetime.now(timezone.utc),
+            created_at=_FIXED_TS,
         )
         mock_db.audit_logs = {1: log1, 2: log2}
 
@@ -421,14 +423,13 @@ class TestAdminServiceExtended:
 
     def test_get_audit_logs_with_filters(self, admin_service, mock_db):
         """Test get_audit_logs with filters"""
-        now = datetime.now(timezone.utc)
         log1 = AuditLog(
             id=1,
             actor="admin_1",
             action="test_action",
             entity="test_entity",
             metadata={},
-            created_at=now,
+            created_at=_FIXED_TS,
         )
         log2 = AuditLog(
             id=2,
@@ -436,7 +437,7 @@ class TestAdminServiceExtended:
             action="another_action",
             entity="another_entity",
             metadata={},
-            created_at=now,
+            created_at=_FIXED_TS,
         )
         mock_db.audit_logs = {1: log1, 2: log2}
 
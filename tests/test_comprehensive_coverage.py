@@ -20,11 +20,6 @@ from alt_exchange.core.models import (Account, AuditLog, Balance, Order, Trade,
 from alt_exchange.infra.database.in_memory import (InMemoryDatabase,
                                                    InMemoryUnitOfWork)
 from alt_exchange.infra.event_bus import InMemoryEventBus
-from alt_exchange.services.account.service import AccountService
-from alt_exchange.services.admin.service import AdminService
-from alt_exchange.services.market_data.broadcaster import MarketDataBroadcaster
-from alt_exchange.services.matching.engine import MatchingEngine
-from alt_exchange.services.wallet.service import WalletService
 
 
 class TestComprehensiveCoverage:
@@ -32,6 +27,15 @@ class TestComprehensiveCoverage:
 
     def setup_method(self):
         """Set up test fixtures"""
+        # Service imports are deferred so collecting this module does not pull
+        # in the full service graph.
+        from alt_exchange.services.account.service import AccountService
+        from alt_exchange.services.admin.service import AdminService
+        from alt_exchange.services.market_data.broadcaster import \
+            MarketDataBroadcaster
+        from alt_exchange.services.matching.engine import MatchingEngine
+        from alt_exchange.services.wallet.service import WalletService
+
         self.db = InMemoryDatabase()
         self.event_bus = InMemoryEventBus()
 
@@ -2,6 +2,7 @@
 Core models 테스트
 """
 
+import pickle
 from datetime import datetime, timezone
 from decimal import Decimal
 
@@ -13,14 +14,37 @@ from alt_exchange.core.enums import (AccountStatus, Asset, OrderStatus,
 from alt_exchange.core.models import (Account, AuditLog, Balance, Order, Trade,
                                       Transaction, User)
 
+_D100 = Decimal("100.0")
+_D10 = Decimal("10.0")
+_D7 = Decimal("7.0")
+_D5 = Decimal("5.0")
+_D3 = Decimal("3.0")
+_D0_5 = Decimal("0.5")
+
+_ORDER_BASE = dict(
+    id=1,
+    user_id=1,
+    account_id=1,
+    market="ALT/USDT",
+    side=Side.BUY,
+    type=OrderType.LIMIT,
+    time_in_force=TimeInForce.GTC,
+    price=_D100,
+    amount=_D10,
+)
+
+
+def _make_order(**overrides):
+    return Order(**{**_ORDER_BASE, **overrides})
+
 
 class TestUser:
-    def test_user_creation(self):
+    def test_user_creation(self, assert_auto_ts):
         user = User(id=1, email="test@example.com", password_hash="hashed_password")
         assert user.id == 1
         assert user.email == "test@example.com"
         assert user.password_hash == "hashed_password"
-        assert isinstance(user.created_at, datetime)
+        assert_auto_ts(user)
 
     def test_user_with_optional_fields(self):
         user = User(
@@ -43,35 +67,25 @@ class TestAccount:
 
 
 class TestBalance:
-    def test_balance_creation(self):
+    def test_balance_creation(self, assert_auto_ts):
         balance = Balance(
             id=1,
             account_id=1,
             asset=Asset.ALT,
-            available=Decimal("100.0"),
-            locked=Decimal("10.0"),
+            available=_D100,
+            locked=_D10,
         )
         assert balance.id == 1
         assert balance.account_id == 1
         assert balance.asset == Asset.ALT
-        assert balance.available == Decimal("100.0")
-        assert balance.locked == Decimal("10.0")
-        assert isinstance(balance.updated_at, datetime)
+        assert balance.available == _D100
+        assert balance.locked == _D10
+        assert_auto_ts(balance, "updated_at")
 
 
 class TestOrder:
     def test_order_creation(self):
-        order = Order(
-            id=1,
-            user_id=1,
-            account_id=1,
-            market="ALT/USDT",
-            side=Side.BUY,
-            type=OrderType.LIMIT,
-            time_in_force=TimeInForce.GTC,
-            price=Decimal("100.0"),
-            amount=Decimal("10.0"),
-        )
+        order = _make_order()
         assert order.id == 1
         assert order.user_id == 1
         assert order.account_id == 1
@@ -79,29 +93,28 @@ class TestOrder:
         assert order.side == Side.BUY
         assert order.type == OrderType.LIMIT
         assert order.time_in_force == TimeInForce.GTC
-        assert order.price == Decimal("100.0")
-        assert order.amount == Decimal("10.0")
+        assert order.price == _D100
+        assert order.amount == _D10
         assert order.filled == Decimal("0")
         assert order.status == OrderStatus.OPEN
 
     def test_order_remaining(self):
-        order = Order(
-            id=1,
-            user_id=1,
-            account_id=1,
-            market="ALT/USDT",
-            side=Side.BUY,
-            type=OrderType.LIMIT,
-            time_in_force=TimeInForce.GTC,
-            price=Decimal("100.0"),
-            amount=Decimal("10.0"),
-            filled=Decimal("3.0"),
-        )
-        assert order.remaining() == Decimal("7.0")
+        order = _make_order(filled=_D3)
+        assert order.remaining() == _D7
+
+    def test_order_slots(self):
+        order = _make_order()
+        assert not hasattr(order, "__dict__")
+        with pytest.raises(AttributeError):
+            order.note = "extra"
+
+    def test_order_pickle_roundtrip(self):
+        order = _make_order(filled=_D3)
+        assert pickle.loads(pickle.dumps(order)) == order
 
 
 class TestTrade:
-    def test_trade_creation(self):
+    def test_trade_creation(self, assert_auto_ts):
         trade = Trade(
             id=1,
             buy_order_id=1,
@@ -109,9 +122,9 @@ class TestTrade:
             maker_order_id=1,
             taker_order_id=2,
             taker_side=Side.BUY,
-            price=Decimal("100.0"),
-            amount=Decimal("5.0"),
-            fee=Decimal("0.5"),
+            price=_D100,
+            amount=_D5,
+            fee=_D0_5,
         )
         assert trade.id == 1
         assert trade.buy_order_id == 1
@@ -119,14 +132,14 @@ class TestTrade:
         assert trade.maker_order_id == 1
         assert trade.taker_order_id == 2
         assert trade.taker_side == Side.BUY
-        assert trade.price == Decimal("100.0")
-        assert trade.amount == Decimal("5.0")
-        assert trade.fee == Decimal("0.5")
-        assert isinstance(trade.created_at, datetime)
+        assert trade.price == _D100
+        assert trade.amount == _D5
+        assert trade.fee == _D0_5
+        assert_auto_ts(trade)
 
 
 class TestTransaction:
-    def test_transaction_creation(self):
+    def test_transaction_creation(self, assert_auto_ts):
         transaction = Transaction(
             id=1,
             user_id=1,
@@ -136,7 +149,7 @@ class TestTransaction:
             type=TransactionType.DEPOSIT,
             status=TransactionStatus.PENDING,
             confirmations=0,
-            amount=Decimal("100.0"),
+            amount=_D100,
             address="0xabc",
         )
         assert transaction.id == 1
@@ -147,13 +160,13 @@ class TestTransaction:
         assert transaction.type == TransactionType.DEPOSIT
         assert transaction.status == TransactionStatus.PENDING
         assert transaction.confirmations == 0
-        assert transaction.amount == Decimal("100.0")
+        assert transaction.amount == _D100
         assert transaction.address == "0xabc"
-        assert isinstance(transaction.created_at, datetime)
+        assert_auto_ts(transaction)
 
 
 class TestAuditLog:
-    def test_audit_log_creation(self):
+    def test_audit_log_creation(self, assert_auto_ts):
         audit_log = AuditLog(
             id=1,
             actor="admin_1",
@@ -166,4 +179,4 @@ class TestAuditLog:
         assert audit_log.action == "withdrawal_approved"
         assert audit_log.entity == "transaction"
         assert audit_log.metadata == {"amount": "100.0", "asset": "ALT"}
-        assert isinstance(audit_log.created_at, datetime)
+        assert_auto_ts(audit_log)
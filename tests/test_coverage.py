@@ -0,0 +1,539 @@
+"""
+Tests for database coverage analysis and reporting
+"""
+
+from unittest.mock import MagicMock, sentinel
+
+import pytest
+
+from alt_exchange.core.models import Account, User
+from alt_exchange.infra.database.coverage import (CoverageMetrics,
+                                                  CoverageReport,
+                                                  CoverageTrackingDatabase,
+                                                  DatabaseCoverageAnalyzer)
+from alt_exchange.infra.database.in_memory import InMemoryDatabase
+
+EXPECTED_MEMBERS = [
+    ("expected_methods", "insert_user"),
+    ("expected_methods", "get_user"),
+    ("expected_methods", "get_user_by_email"),
+    ("expected_methods", "insert_account"),
+    ("expected_methods", "get_account"),
+    ("expected_methods", "upsert_balance"),
+    ("expected_methods", "find_balance"),
+    ("expected_methods", "insert_order"),
+    ("expected_methods", "update_order"),
+    ("expected_methods", "get_order"),
+    ("expected_methods", "insert_trade"),
+    ("expected_methods", "get_trade"),
+    ("expected_methods", "insert_transaction"),
+    ("expected_methods", "update_transaction"),
+    ("expected_methods", "get_transaction"),
+    ("expected_methods", "insert_audit"),
+    ("expected_methods", "get_audit_logs"),
+    ("expected_methods", "next_id"),
+    ("expected_data_types", "User"),
+    ("expected_data_types", "Account"),
+    ("expected_data_types", "Balance"),
+    ("expected_data_types", "Order"),
+    ("expected_data_types", "Trade"),
+    ("expected_data_types", "Transaction"),
+    ("expected_data_types", "AuditLog"),
+    ("expected_data_types", "Asset"),
+    ("expected_data_types", "OrderStatus"),
+    ("expected_data_types", "OrderType"),
+    ("expected_data_types", "Side"),
+    ("expected_data_types", "TimeInForce"),
+    ("expected_data_types", "TransactionStatus"),
+    ("expected_data_types", "TransactionType"),
+    ("expected_data_types", "AccountStatus"),
+    ("expected_query_patterns", "single_select"),
+    ("expected_query_patterns", "multi_select"),
+    ("expected_query_patterns", "insert"),
+    ("expected_query_patterns", "update"),
+    ("expected_query_patterns", "upsert"),
+    ("expected_query_patterns", "delete"),
+    ("expected_query_patterns", "join"),
+    ("expected_query_patterns", "filter"),
+    ("expected_query_patterns", "order_by"),
+    ("expected_query_patterns", "limit"),
+    ("expected_query_patterns", "count"),
+    ("expected_query_patterns", "aggregate"),
+    ("expected_query_patterns", "group_by"),
+    ("expected_query_patterns", "having"),
+    ("expected_query_patterns", "subquery"),
+    ("expected_query_patterns", "union"),
+    ("expected_error_scenarios", "not_found"),
+    ("expected_error_scenarios", "duplicate_key"),
+    ("expected_error_scenarios", "foreign_key_violation"),
+    ("expected_error_scenarios", "check_constraint_violation"),
+    ("expected_error_scenarios", "not_null_violation"),
+    ("expected_error_scenarios", "connection_timeout"),
+    ("expected_error_scenarios", "deadlock"),
+    ("expected_error_scenarios", "lock_timeout"),
+    ("expected_error_scenarios", "insufficient_privileges"),
+    ("expected_error_scenarios", "database_unavailable"),
+    ("expected_transaction_patterns", "single_transaction"),
+    ("expected_transaction_patterns", "nested_transaction"),
+    ("expected_transaction_patterns", "distributed_transaction"),
+    ("expected_transaction_patterns", "rollback"),
+    ("expected_transaction_patterns", "commit"),
+    ("expected_transaction_patterns", "savepoint"),
+    ("expected_transaction_patterns", "isolation_levels"),
+    ("expected_transaction_patterns", "concurrent_transactions"),
+    ("expected_transaction_patterns", "long_running_transaction"),
+]
+
+METRICS_DEFAULTS = [
+    ("methods_called", set()),
+    ("methods_total", 0),
+    ("methods_coverage", 0.0),
+    ("data_types_used", set()),
+    ("data_types_total", 0),
+    ("data_types_coverage", 0.0),
+    ("query_patterns", set()),
+    ("query_patterns_total", 0),
+    ("query_patterns_coverage", 0.0),
+    ("error_scenarios", set()),
+    ("error_scenarios_total", 0),
+    ("error_scenarios_coverage", 0.0),
+    ("transaction_patterns", set()),
+    ("transaction_patterns_total", 0),
+    ("transaction_patterns_coverage", 0.0),
+    ("overall_coverage", 0.0),
+    ("avg_response_time", 0.0),
+    ("max_response_time", 0.0),
+    ("min_response_time", float("inf")),
+    ("total_errors", 0),
+    ("error_rate", 0.0),
+]
+
+ANALYZER_DEFAULTS = [
+    ("call_counts", {}),
+    ("response_times", {}),
+    ("errors", {}),
+    ("data_types_used", set()),
+    ("query_patterns", set()),
+    ("error_scenarios", set()),
+    ("transaction_patterns", set()),
+]
+
+ANALYZER_EXPECTED_ATTRS = [
+    "expected_methods",
+    "expected_data_types",
+    "expected_query_patterns",
+    "expected_error_scenarios",
+    "expected_transaction_patterns",
+]
+
+
+@pytest.fixture(scope="module")
+def mock_database():
+    """Shared mock database for tests that never configure or inspect it"""
+    return MagicMock()
+
+
+@pytest.fixture(scope="module")
+def analyzer_ro(mock_database):
+    """Shared analyzer for read-only assertions"""
+    return DatabaseCoverageAnalyzer(mock_database)
+
+
+@pytest.mark.parametrize("attr,expected", METRICS_DEFAULTS)
+def test_metrics_defaults(attr, expected):
+    assert getattr(CoverageMetrics(), attr) == expected
+
+
+def test_report_defaults():
+    report = CoverageReport()
+
+    assert report.timestamp > 0
+    assert report.metrics == CoverageMetrics()
+    assert report.detailed_metrics == {}
+    assert report.recommendations == []
+
+
+def test_analyzer_database(analyzer_ro, mock_database):
+    assert analyzer_ro.database is mock_database
+
+
+@pytest.mark.parametrize("attr,expected", ANALYZER_DEFAULTS)
+def test_analyzer_defaults(analyzer_ro, attr, expected):
+    assert getattr(analyzer_ro, attr) == expected
+
+
+@pytest.mark.parametrize("attr", ANALYZER_EXPECTED_ATTRS)
+def test_analyzer_expected_targets_defined(analyzer_ro, attr):
+    assert getattr(analyzer_ro, attr)
+
+
+class TestCoverageTrackingDatabase:
+    """Tests for CoverageTrackingDatabase and DatabaseCoverageAnalyzer"""
+
+    @pytest.fixture
+    def mock_database_fresh(self):
+        """Per-test mock database for tests that set return values or side effects"""
+        return MagicMock()
+
+    @pytest.fixture
+    def coverage_db(self, mock_database):
+        """CoverageTrackingDatabase with mocked database"""
+        return CoverageTrackingDatabase(mock_database)
+
+    @pytest.fixture
+    def analyzer(self, mock_database):
+        """Per-test analyzer for tests that record calls"""
+        return DatabaseCoverageAnalyzer(mock_database)
+
+    def test_coverage_database_initialization(self, coverage_db, mock_database):
+        """Test CoverageTrackingDatabase initialization"""
+        assert coverage_db.database is mock_database
+        assert coverage_db.analyzer is not None
+
+    def test_coverage_report_to_dict(self):
+        """Test CoverageReport to_dict method"""
+        report = CoverageReport()
+        report_dict = report.to_dict()
+
+        assert "timestamp" in report_dict
+        assert "metrics" in report_dict
+        assert "detailed_metrics" in report_dict
+        assert "recommendations" in report_dict
+        assert report_dict["metrics"]["methods_coverage"] == 0.0
+        assert report_dict["metrics"]["data_types_coverage"] == 0.0
+        assert report_dict["metrics"]["query_patterns_coverage"] == 0.0
+        assert report_dict["metrics"]["error_scenarios_coverage"] == 0.0
+        assert report_dict["metrics"]["transaction_patterns_coverage"] == 0.0
+        assert report_dict["metrics"]["overall_coverage"] == 0.0
+
+    def test_record_method_call_success(self, analyzer):
+        """Test recording successful method call"""
+        analyzer.record_method_call("get_user", 10.5, success=True)
+
+        assert analyzer.call_counts["get_user"] == 1
+        assert analyzer.response_times["get_user"] == [10.5]
+        assert len(analyzer.errors) == 0
+
+    def test_record_method_call_failure(self, analyzer):
+        """Test recording failed method call"""
+        analyzer.record_method_call(
+            "get_user", 5.0, success=False, error_type="NotFound"
+        )
+
+        assert analyzer.call_counts["get_user"] == 1
+        assert analyzer.response_times["get_user"] == [5.0]
+        assert analyzer.errors["NotFound"] == 1
+        assert "NotFound" in analyzer.error_scenarios
+
+    def test_record_data_type_usage(self, analyzer):
+        """Test recording data type usage"""
+        analyzer.record_data_type_usage("User")
+        analyzer.record_data_type_usage("Account")
+
+        assert "User" in analyzer.data_types_used
+        assert "Account" in analyzer.data_types_used
+        assert len(analyzer.data_types_used) == 2
+
+    def test_record_transaction_pattern(self, analyzer):
+        """Test recording transaction pattern"""
+        analyzer.record_transaction_pattern("single_transaction")
+        analyzer.record_transaction_pattern("rollback")
+
+        assert "single_transaction" in analyzer.transaction_patterns
+        assert "rollback" in analyzer.transaction_patterns
+        assert len(analyzer.transaction_patterns) == 2
+
+    def test_generate_report(self, analyzer):
+        """Test generating coverage report"""
+        # Record some data
+        analyzer.record_method_call("get_user", 10.0, success=True)
+        analyzer.record_method_call("insert_user", 15.0, success=True)
+        analyzer.record_data_type_usage("User")
+        analyzer.record_transaction_pattern("single_transaction")
+
+        report = analyzer.generate_report()
+
+        assert report is not None
+        assert report.metrics is not None
+        assert report.detailed_metrics is not None
+        assert report.recommendations is not None
+        assert report.metrics.methods_coverage > 0
+        assert report.metrics.data_types_coverage > 0
+        assert report.metrics.transaction_patterns_coverage > 0
+        assert report.metrics.avg_response_time == 12.5
+        assert report.metrics.max_response_time == 15.0
+        assert report.metrics.min_response_time == 10.0
+
+    def test_generate_report_response_time_percentiles(self, analyzer):
+        """Test per-method response times include nearest-rank percentiles"""
+        for ms in range(1, 101):
+            analyzer.record_method_call("get_user", float(ms))
+
+        report = analyzer.generate_report()
+
+        times = report.detailed_metrics["method_response_times"]["get_user"]
+        assert times == {
+            "avg": 50.5,
+            "max": 100.0,
+            "min": 1.0,
+            "p50": 50.0,
+            "p95": 95.0,
+            "p99": 99.0,
+            "count": 100,
+            "total": 5050.0,
+        }
+
+    def test_generate_report_weighted_avg_response_time(self, analyzer):
+        """Test the overall average weights each method by its sample count"""
+        for ms in (1.0, 2.0, 3.0):
+            analyzer.record_method_call("get_user", ms)
+        analyzer.record_method_call("insert_user", 10.0)
+
+        report = analyzer.generate_report()
+
+        assert report.metrics.avg_response_time == 4.0
+        assert report.metrics.max_response_time == 10.0
+        assert report.metrics.min_response_time == 1.0
+
+    def test_generate_report_empty(self, analyzer):
+        """Test generating coverage report with no data"""
+        report = analyzer.generate_report()
+
+        assert report is not None
+        assert report.metrics.methods_coverage == 0.0
+        assert report.metrics.data_types_coverage == 0.0
+        assert report.metrics.query_patterns_coverage == 0.0
+        assert report.metrics.error_scenarios_coverage == 0.0
+        assert report.metrics.transaction_patterns_coverage == 0.0
+        assert report.metrics.overall_coverage == 0.0
+
+    def test_coverage_tracking_database_wrapper(self, mock_database_fresh):
+        """Test CoverageTrackingDatabase wrapper functionality"""
+        coverage_db = CoverageTrackingDatabase(mock_database_fresh)
+
+        # Mock the database method
+        mock_database_fresh.get_user.return_value = sentinel.user
+
+        # Call through the wrapper
+        result = coverage_db.get_user(1)
+
+        # Verify the method was called
+        mock_database_fresh.get_user.assert_called_once_with(1)
+        assert result is sentinel.user
+
+    def test_coverage_tracking_database_error_handling(self, mock_database_fresh):
+        """Test CoverageTrackingDatabase error handling"""
+        coverage_db = CoverageTrackingDatabase(mock_database_fresh)
+
+        # Mock the database method to raise an exception
+        mock_database_fresh.get_user.side_effect = Exception("Database error")
+
+        # Call should raise the exception
+        with pytest.raises(Exception, match="Database error"):
+            coverage_db.get_user(1)
+
+    def test_next_ids_tracked_once(self, mock_database_fresh):
+        """Test CoverageTrackingDatabase records a bulk ID allocation as one call"""
+        coverage_db = CoverageTrackingDatabase(mock_database_fresh)
+        mock_database_fresh.next_ids.return_value = range(1, 4)
+
+        assert coverage_db.next_ids("orders", 3) == range(1, 4)
+        mock_database_fresh.next_ids.assert_called_once_with("orders", 3)
+        assert coverage_db.analyzer.call_counts == {"next_ids": 1}
+
+    def test_disabled_passes_through(self, mock_database_fresh):
+        """Test a disabled CoverageTrackingDatabase records nothing"""
+        coverage_db = CoverageTrackingDatabase(mock_database_fresh)
+        coverage_db.enabled = False
+        mock_database_fresh.insert_user.return_value = sentinel.user
+
+        assert coverage_db.insert_user(sentinel.user) is sentinel.user
+        mock_database_fresh.insert_user.assert_called_once_with(sentinel.user)
+        assert coverage_db.analyzer.call_counts == {}
+        assert coverage_db.analyzer.data_types_used == set()
+
+    def test_get_users_tracked_once(self, mock_database_fresh):
+        """Test CoverageTrackingDatabase records a bulk user lookup as one call"""
+        coverage_db = CoverageTrackingDatabase(mock_database_fresh)
+        mock_database_fresh.get_users.return_value = [sentinel.user, None]
+
+        assert coverage_db.get_users([1, 2]) == [sentinel.user, None]
+        mock_database_fresh.get_users.assert_called_once_with([1, 2])
+        assert coverage_db.analyzer.call_counts == {"get_users": 1}
+
+    def test_insert_many_tracked_once(self, mock_database_fresh):
+        """Test CoverageTrackingDatabase records a bulk insert as one call"""
+        coverage_db = CoverageTrackingDatabase(mock_database_fresh)
+        objs = [
+            User(id=1, email="test@example.com", password_hash="hashed_password"),
+            Account(id=1, user_id=1),
+        ]
+
+        coverage_db.insert_many(objs)
+
+        mock_database_fresh.insert_many.assert_called_once_with(objs)
+        assert coverage_db.analyzer.call_counts == {"insert_many": 1}
+        assert coverage_db.analyzer.data_types_used == {"User", "Account"}
+
+    def test_insert_many_generator(self):
+        """Test a generator passed to insert_many is stored, not consumed early"""
+        coverage_db = CoverageTrackingDatabase(InMemoryDatabase())
+
+        coverage_db.insert_many(Account(id=i, user_id=1) for i in range(1, 4))
+
+        assert sorted(coverage_db.database.accounts) == [1, 2, 3]
+        assert coverage_db.analyzer.data_types_used == {"Account"}
+
+    def test_insert_many_unsupported_type_records_no_types(self):
+        """Test data types are not recorded when the backend rejects the batch"""
+        coverage_db = CoverageTrackingDatabase(InMemoryDatabase())
+
+        with pytest.raises(TypeError):
+            coverage_db.insert_many(["not a model"])
+
+        assert coverage_db.analyzer.data_types_used == set()
+        assert coverage_db.analyzer.errors == {"TypeError": 1}
+
+    def test_generate_coverage_report_reflects_new_calls(self, mock_database_fresh):
+        """Test each coverage report includes calls made since the last one"""
+        coverage_db = CoverageTrackingDatabase(mock_database_fresh)
+        coverage_db.get_user(1)
+        report = coverage_db.generate_coverage_report()
+
+        coverage_db.get_account(1)
+
+        fresh = coverage_db.generate_coverage_report()
+        assert fresh is not report
+        assert fresh.detailed_metrics["method_call_counts"] == {
+            "get_user": 1,
+            "get_account": 1,
+        }
+
+    def test_reset_coverage(self, mock_database_fresh):
+        """Test CoverageTrackingDatabase discards recorded calls on reset"""
+        coverage_db = CoverageTrackingDatabase(mock_database_fresh)
+        coverage_db.get_user(1)
+
+        coverage_db.reset_coverage()
+
+        assert coverage_db.analyzer.database is mock_database_fresh
+        assert coverage_db.analyzer.call_counts == {}
+
+    def test_coverage_tracking_database_timing(self, mock_database_fresh, monkeypatch):
+        """Test CoverageTrackingDatabase timing functionality"""
+        coverage_db = CoverageTrackingDatabase(mock_database_fresh)
+
+        # Script the wrapper's clock instead of sleeping: 11ms elapsed
+        monkeypatch.setattr(
+            "alt_exchange.infra.database.coverage.time.perf_counter_ns",
+            iter([0, 11_000_000]).__next__,
+        )
+        mock_database_fresh.get_user.return_value = sentinel.user
+
+        # Call through the wrapper
+        result = coverage_db.get_user(1)
+
+        # Verify timing was recorded
+        assert result is not None
+        assert "get_user" in coverage_db.analyzer.call_counts
+        assert len(coverage_db.analyzer.response_times["get_user"]) == 1
+        assert coverage_db.analyzer.response_times["get_user"] == [11.0]
+
+    def test_generate_coverage_report(self, mock_database_fresh):
+        """Test generating coverage report from CoverageTrackingDatabase"""
+        coverage_db = CoverageTrackingDatabase(mock_database_fresh)
+
+        # Record some activity
+        coverage_db.get_user(1)
+        coverage_db.insert_user(sentinel.user_payload)
+
+        # Generate report
+        report = coverage_db.generate_coverage_report()
+
+        assert report is not None
+        assert report.metrics is not None
+        assert report.detailed_metrics is not None
+        assert report.recommendations is not None
+
+    @pytest.mark.parametrize("attr,item", EXPECTED_MEMBERS)
+    def test_expected_member(self, analyzer_ro, attr, item):
+        """Test that expected coverage targets are properly defined"""
+        assert item in getattr(analyzer_ro, attr)
+
+
+class TestCoverageMetrics:
+    """Tests for CoverageMetrics field assignment"""
+
+    def test_coverage_metrics_calculation(self):
+        """Test CoverageMetrics calculation."""
+        metrics = CoverageMetrics()
+        metrics.methods_total = 100
+        metrics.methods_called = {"method1", "method2", "method3"}
+        metrics.methods_coverage = 85.0
+        metrics.data_types_total = 50
+        metrics.data_types_used = {"User", "Order", "Trade"}
+        metrics.data_types_coverage = 90.0
+        metrics.overall_coverage = 80.0
+
+        assert metrics.methods_total == 100
+        assert len(metrics.methods_called) == 3
+        assert metrics.methods_coverage == 85.0
+        assert metrics.data_types_total == 50
+        assert len(metrics.data_types_used) == 3
+        assert metrics.data_types_coverage == 90.0
+        assert metrics.overall_coverage == 80.0
+
+    def test_coverage_metrics_edge_cases(self):
+        """Test CoverageMetrics edge cases."""
+        metrics = CoverageMetrics()
+
+        # Test zero values
+        metrics.methods_total = 0
+        metrics.methods_called = set()
+        metrics.methods_coverage = 0.0
+        metrics.data_types_total = 0
+        metrics.data_types_used = set()
+        metrics.data_types_coverage = 0.0
+        metrics.overall_coverage = 0.0
+
+        assert metrics.methods_total == 0
+        assert len(metrics.methods_called) == 0
+        assert metrics.methods_coverage == 0.0
+        assert metrics.data_types_total == 0
+        assert len(metrics.data_types_used) == 0
+        assert metrics.data_types_coverage == 0.0
+        assert metrics.overall_coverage == 0.0
+
+    def test_coverage_metrics_high_values(self):
+        """Test CoverageMetrics with high values."""
+        metrics = CoverageMetrics()
+
+        # Test high values
+        metrics.methods_total = 10000
+        metrics.methods_called = set(range(9500))
+        metrics.methods_coverage = 95.0
+        metrics.data_types_total = 1000
+        metrics.data_types_used = set(range(980))
+        metrics.data_types_coverage = 98.0
+        metrics.overall_coverage = 95.0
+
+        assert metrics.methods_total == 10000
+        assert len(metrics.methods_called) == 9500
+        assert metrics.methods_coverage == 95.0
+        assert metrics.data_types_total == 1000
+        assert len(metrics.data_types_used) == 980
+        assert metrics.data_types_coverage == 98.0
+        assert metrics.overall_coverage == 95.0
+
+    def test_coverage_metrics_float_precision(self):
+        """Test CoverageMetrics float precision."""
+        metrics = CoverageMetrics()
+
+        # Test decimal precision
+        metrics.methods_coverage = 85.123456789
+        metrics.data_types_coverage = 90.987654321
+        metrics.overall_coverage = 88.555555555
+
+        assert metrics.methods_coverage == 85.123456789
+        assert metrics.data_types_coverage == 90.987654321
+        assert metrics.overall_coverage == 88.555555555
@@ -1,355 +0,0 @@
-"""
-Simple tests for CoverageTrackingDatabase to improve coverage
-"""
-
-from datetime import datetime, timezone
-from unittest.mock import MagicMock, patch
-
-import pytest
-
-from alt_exchange.infra.database.coverage import (CoverageMetrics,
-                                                  CoverageReport,
-                                                  CoverageTrackingDatabase,
-                                                  DatabaseCoverageAnalyzer)
-from alt_exchange.infra.database.in_memory import InMemoryDatabase
-
-
-class TestCoverageTrackingDatabaseSimple:
-    """Simple tests for CoverageTrackingDatabase"""
-
-    @pytest.fixture
-    def mock_database(self):
-        """Mock database for testing"""
-        return MagicMock()
-
-    @pytest.fixture
-    def coverage_db(self, mock_database):
-        """CoverageTrackingDatabase with mocked database"""
-        return CoverageTrackingDatabase(mock_database)
-
-    def test_coverage_database_initialization(self, coverage_db):
-        """Test CoverageTrackingDatabase initialization"""
-        assert coverage_db is not None
-        assert coverage_db.database is not None
-        assert coverage_db.analyzer is not None
-
-    def test_coverage_metrics_initialization(self):
-        """Test CoverageMetrics initialization"""
-        metrics = CoverageMetrics()
-
-        assert metrics.methods_called == set()
-        assert metrics.methods_total == 0
-        assert metrics.methods_coverage == 0.0
-        assert metrics.data_types_used == set()
-        assert metrics.data_types_total == 0
-        assert metrics.data_types_coverage == 0.0
-        assert metrics.query_patterns == set()
-        assert metrics.query_patterns_total == 0
-        assert metrics.query_patterns_coverage == 0.0
-        assert metrics.error_scenarios == set()
-        assert metrics.error_scenarios_total == 0
-        assert metrics.error_scenarios_coverage == 0.0
-        assert metrics.transaction_patterns == set()
-        assert metrics.transaction_patterns_total == 0
-        assert metrics.transaction_patterns_coverage == 0.0
-        assert metrics.overall_coverage == 0.0
-        assert metrics.avg_response_time == 0.0
-        assert metrics.max_response_time == 0.0
-        assert metrics.min_response_time == float("inf")
-        assert metrics.total_errors == 0
-        assert metrics.error_rate == 0.0
-
-    def test_coverage_report_initialization(self):
-        """Test CoverageReport initialization"""
-        report = CoverageReport()
-
-        assert report.timestamp > 0
-        assert report.metrics is not None
-        assert report.detailed_metrics == {}
-        assert report.recommendations == []
-
-    def test_coverage_report_to_dict(self):
-        """Test CoverageReport to_dict method"""
-        report = CoverageReport()
-        report_dict = report.to_dict()
-
-        assert "timestamp" in report_dict
-        assert "metrics" in report_dict
-        assert "detailed_metrics" in report_dict
-        assert "recommendations" in report_dict
-        assert report_dict["metrics"]["methods_coverage"] == 0.0
-        assert report_dict["metrics"]["data_types_coverage"] == 0.0
-        assert report_dict["metrics"]["query_patterns_coverage"] == 0.0
-        assert report_dict["metrics"]["error_scenarios_coverage"] == 0.0
-        assert report_dict["metrics"]["transaction_patterns_coverage"] == 0.0
-        assert report_dict["metrics"]["overall_coverage"] == 0.0
-
-    def test_database_coverage_analyzer_initialization(self, mock_database):
-        """Test DatabaseCoverageAnalyzer initialization"""
-        analyzer = DatabaseCoverageAnalyzer(mock_database)
-
-        assert analyzer.database == mock_database
-        assert analyzer.call_counts == {}
-        assert analyzer.response_times == {}
-        assert analyzer.errors == {}
-        assert analyzer.data_types_used == set()
-        assert analyzer.query_patterns == set()
-        assert analyzer.error_scenarios == set()
-        assert analyzer.transaction_patterns == set()
-        assert analyzer.expected_methods is not None
-        assert analyzer.expected_data_types is not None
-        assert analyzer.expected_query_patterns is not None
-        assert analyzer.expected_error_scenarios is not None
-        assert analyzer.expected_transaction_patterns is not None
-
-    def test_record_method_call_success(self, mock_database):
-        """Test recording successful method call"""
-        analyzer = DatabaseCoverageAnalyzer(mock_database)
-
-        analyzer.record_method_call("get_user", 10.5, success=True)
-
-        assert analyzer.call_counts["get_user"] == 1
-        assert analyzer.response_times["get_user"] == [10.5]
-        assert len(analyzer.errors) == 0
-
-    def test_record_method_call_failure(self, mock_database):
-        """Test recording failed method call"""
-        analyzer = DatabaseCoverageAnalyzer(mock_database)
-
-        analyzer.record_method_call(
-            "get_user", 5.0, success=False, error_type="NotFound"
-        )
-
-        assert analyzer.call_counts["get_user"] == 1
-        assert analyzer.response_times["get_user"] == [5.0]
-        assert analyzer.errors["NotFound"] == 1
-        assert "NotFound" in analyzer.error_scenarios
-
-    def test_record_data_type_usage(self, mock_database):
-        """Test recording data type usage"""
-        analyzer = DatabaseCoverageAnalyzer(mock_database)
-
-        analyzer.record_data_type_usage("User")
-        analyzer.record_data_type_usage("Account")
-
-        assert "User" in analyzer.data_types_used
-        assert "Account" in analyzer.data_types_used
-        assert len(analyzer.data_types_used) == 2
-
-    def test_record_transaction_pattern(self, mock_database):
-        """Test recording transaction pattern"""
-        analyzer = DatabaseCoverageAnalyzer(mock_database)
-
-        analyzer.record_transaction_pattern("single_transaction")
-        analyzer.record_transaction_pattern("rollback")
-
-        assert "single_transaction" in analyzer.transaction_patterns
-        assert "rollback" in analyzer.transaction_patterns
-        assert len(analyzer.transaction_patterns) == 2
-
-    def test_generate_report(self, mock_database):
-        """Test generating coverage report"""
-        analyzer = DatabaseCoverageAnalyzer(mock_database)
-
-        # Record some data
-        analyzer.record_method_call("get_user", 10.0, success=True)
-        analyzer.record_method_call("insert_user", 15.0, success=True)
-        analyzer.record_data_type_usage("User")
-        analyzer.record_transaction_pattern("single_transaction")
-
-        report = analyzer.generate_report()
-
-        assert report is not None
-        assert report.metrics is not None
-        assert report.detailed_metrics is not None
-        assert report.recommendations is not None
-        assert report.metrics.methods_coverage > 0
-        assert report.metrics.data_types_coverage > 0
-        assert report.metrics.transaction_patterns_coverage > 0
-
-    def test_generate_report_empty(self, mock_database):
-        """Test generating coverage report with no data"""
-        analyzer = DatabaseCoverageAnalyzer(mock_database)
-
-        report = analyzer.generate_report()
-
-        assert report is not None
-        assert report.metrics.methods_coverage == 0.0
-        assert report.metrics.data_types_coverage == 0.0
-        assert report.metrics.query_patterns_coverage == 0.0
-        assert report.metrics.error_scenarios_coverage == 0.0
-        assert report.metrics.transaction_patterns_coverage == 0.0
-        assert report.metrics.overall_coverage == 0.0
-
-    def test_coverage_tracking_database_wrapper(self, mock_database):
-        """Test CoverageTrackingDatabase wrapper functionality"""
-        coverage_db = CoverageTrackingDatabase(mock_database)
-
-        # Mock the database method
-        mock_database.get_user.return_value = MagicMock()
-
-        # Call through the wrapper
-        result = coverage_db.get_user(1)
-
-        # Verify the method was called
-        mock_database.get_user.assert_called_once_with(1)
-        assert result is not None
-
-    def test_coverage_tracking_database_error_handling(self, mock_database):
-        """Test CoverageTrackingDatabase error handling"""
-        coverage_db = CoverageTrackingDatabase(mock_database)
-
-        # Mock the database method to raise an exception
-        mock_database.get_user.side_effect = Exception("Database error")
-
-        # Call should raise the exception
-        with pytest.raises(Exception, match="Database error"):
-            coverage_db.get_user(1)
-
-    def test_coverage_tracking_database_timing(self, mock_database):
-        """Test CoverageTrackingDatabase timing functionality"""
-        coverage_db = CoverageTrackingDatabase(mock_database)
-
-        # Mock the database method with a delay
-        def slow_method(*args, **kwargs):
-            import time
-
-            time.sleep(0.01)  # 10ms delay
-            return MagicMock()
-
-        mock_database.get_user.side_effect = slow_method
-
-        # Call through the wrapper
-        result = coverage_db.get_user(1)
-
-        # Verify timing was recorded
-        assert result is not None
-        assert "get_user" in coverage_db.analyzer.call_counts
-        assert len(coverage_db.analyzer.response_times["get_user"]) == 1
-        assert (
-            coverage_db.analyzer.response_times["get_user"][0] >= 10.0
-        )  # At least 10ms
-
-    def test_generate_coverage_report(self, mock_database):
-        """Test generating coverage report from CoverageTrackingDatabase"""
-        coverage_db = CoverageTrackingDatabase(mock_database)
-
-        # Record some activity
-        coverage_db.get_user(1)
-        coverage_db.insert_user(MagicMock())
-
-        # Generate report
-        report = coverage_db.generate_coverage_report()
-
-        assert report is not None
-        assert report.metrics is not None
-        assert report.detailed_metrics is not None
-        assert report.recommendations is not None
-
-    def test_expected_methods_coverage(self, mock_database):
-        """Test that expected methods are properly defined"""
-        analyzer = DatabaseCoverageAnalyzer(mock_database)
-
-        expected_methods = analyzer.expected_methods
-
-        # Check that key methods are expected
-        assert "insert_user" in expected_methods
-        assert "get_user" in expected_methods
-        assert "get_user_by_email" in expected_methods
-        assert "insert_account" in expected_methods
-        assert "get_account" in expected_methods
-        assert "upsert_balance" in expected_methods
-        assert "find_balance" in expected_methods
-        assert "insert_order" in expected_methods
-        assert "update_order" in expected_methods
-        assert "get_order" in expected_methods
-        assert "insert_trade" in expected_methods
-        assert "get_trade" in expected_methods
-        assert "insert_transaction" in expected_methods
-        assert "update_transaction" in expected_methods
-        assert "get_transaction" in expected_methods
-        assert "insert_audit" in expected_methods
-        assert "get_audit_logs" in expected_methods
-        assert "next_id" in expected_methods
-
-    def test_expected_data_types_coverage(self, mock_database):
-        """Test that expected data types are properly defined"""
-        analyzer = DatabaseCoverageAnalyzer(mock_database)
-
-        expected_data_types = analyzer.expected_data_types
-
-        # Check that key data types are expected
-        assert "User" in expected_data_types
-        assert "Account" in expected_data_types
-        assert "Balance" in expected_data_types
-        assert "Order" in expected_data_types
-        assert "Trade" in expected_data_types
-        assert "Transaction" in expected_data_types
-        assert "AuditLog" in expected_data_types
-        assert "Asset" in expected_data_types
-        assert "OrderStatus" in expected_data_types
-        assert "OrderType" in expected_data_types
-        assert "Side" in expected_data_types
-        assert "TimeInForce" in expected_data_types
-        assert "TransactionStatus" in expected_data_types
-        assert "TransactionType" in expected_data_types
-        assert "AccountStatus" in expected_data_types
-
-    def test_expected_query_patterns_coverage(self, mock_database):
-        """Test that expected query patterns are properly defined"""
-        analyzer = DatabaseCoverageAnalyzer(mock_database)
-
-        expected_query_patterns = analyzer.expected_query_patterns
-
-        # Check that key query patterns are expected
-        assert "single_select" in expected_query_patterns
-        assert "multi_select" in expected_query_patterns
-        assert "insert" in expected_query_patterns
-        assert "update" in expected_query_patterns
-        assert "upsert" in expected_query_patterns
-        assert "delete" in expected_query_patterns
-        assert "join" in expected_query_patterns
-        assert "filter" in expected_query_patterns
-        assert "order_by" in expected_query_patterns
-        assert "limit" in expected_query_patterns
-        assert "count" in expected_query_patterns
-        assert "aggregate" in expected_query_patterns
-        assert "group_by" in expected_query_patterns
-        assert "having" in expected_query_patterns
-        assert "subquery" in expected_query_patterns
-        assert "union" in expected_query_patterns
-
-    def test_expected_error_scenarios_coverage(self, mock_database):
-        """Test that expected error scenarios are properly defined"""
-        analyzer = DatabaseCoverageAnalyzer(mock_database)
-
-        expected_error_scenarios = analyzer.expected_error_scenarios
-
-        # Check that key error scenarios are expected
-        assert "not_found" in expected_error_scenarios
-        assert "duplicate_key" in expected_error_scenarios
-        assert "foreign_key_violation" in expected_error_scenarios
-        assert "check_constraint_violation" in expected_error_scenarios
-        assert "not_null_violation" in expected_error_scenarios
-        assert "connection_timeout" in expected_error_scenarios
-        assert "deadlock" in expected_error_scenarios
-        assert "lock_timeout" in expected_error_scenarios
-        assert "insufficient_privileges" in expected_error_scenarios
-        assert "database_unavailable" in expected_error_scenarios
-
-    def test_expected_transaction_patterns_coverage(self, mock_database):
-        """Test that expected transaction patterns are properly defined"""
-        analyzer = DatabaseCoverageAnalyzer(mock_database)
-
-        expected_transaction_patterns = analyzer.expected_transaction_patterns
-
-        # Check that key transaction patterns are expected
-        assert "single_transaction" in expected_transaction_patterns
-        assert "nested_transaction" in expected_transaction_patterns
-        assert "distributed_transaction" in expected_transaction_patterns
-        assert "rollback" in expected_transaction_patterns
-        assert "commit" in expected_transaction_patterns
-        assert "savepoint" in expected_transaction_patterns
-        assert "isolation_levels" in expected_transaction_patterns
-        assert "concurrent_transactions" in expected_transaction_patterns
-        assert "long_running_transaction" in expected_transaction_patterns
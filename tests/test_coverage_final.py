@@ -1,168 +0,0 @@
-"""Tests for coverage.py to improve coverage to 95%."""
-
-from datetime import datetime, timezone
-from decimal import Decimal
-from unittest.mock import Mock, patch
-
-import pytest
-
-from alt_exchange.infra.database.coverage import (CoverageMetrics,
-                                                  CoverageReport,
-                                                  CoverageTrackingDatabase,
-                                                  DatabaseCoverageAnalyzer)
-
-
-class TestCoverageFinal:
-    """Test class for final coverage of coverage.py."""
-
-    @pytest.fixture
-    def mock_db(self):
-        """Mock database."""
-        return Mock()
-
-    @pytest.fixture
-    def coverage_tracking_db(self, mock_db):
-        """CoverageTrackingDatabase instance."""
-        return CoverageTrackingDatabase(mock_db)
-
-    @pytest.fixture
-    def analyzer(self, mock_db):
-        """DatabaseCoverageAnalyzer instance."""
-        return DatabaseCoverageAnalyzer(mock_db)
-
-    def test_coverage_tracking_database_init(self, mock_db):
-        """Test CoverageTrackingDatabase initialization."""
-        db = CoverageTrackingDatabase(mock_db)
-        assert db.database is mock_db
-
-    def test_database_coverage_analyzer_init(self, mock_db):
-        """Test DatabaseCoverageAnalyzer initialization."""
-        analyzer = DatabaseCoverageAnalyzer(mock_db)
-        assert analyzer.database is mock_db
-
-    def test_coverage_metrics_init(self):
-        """Test CoverageMetrics initialization."""
-        metrics = CoverageMetrics()
-        assert metrics.methods_total == 0
-        assert metrics.methods_coverage == 0.0
-        assert metrics.data_types_total == 0
-        assert metrics.data_types_coverage == 0.0
-        assert metrics.overall_coverage == 0.0
-
-    def test_coverage_report_init(self):
-        """Test CoverageReport initialization."""
-        timestamp = datetime.now(timezone.utc)
-        metrics = CoverageMetrics()
-        report = CoverageReport(timestamp=timestamp, metrics=metrics)
-        assert report.timestamp == timestamp
-        assert report.metrics == metrics
-
-    def test_coverage_metrics_calculation(self):
-        """Test CoverageMetrics calculation."""
-        metrics = CoverageMetrics()
-        metrics.methods_total = 100
-        metrics.methods_called = {"method1", "method2", "method3"}
-        metrics.methods_coverage = 85.0
-        metrics.data_types_total = 50
-        metrics.data_types_used = {"User", "Order", "Trade"}
-        metrics.data_types_coverage = 90.0
-        metrics.overall_coverage = 80.0
-
-        assert metrics.methods_total == 100
-        assert len(metrics.methods_called) == 3
-        assert metrics.methods_coverage == 85.0
-        assert metrics.data_types_total == 50
-        assert len(metrics.data_types_used) == 3
-        assert metrics.data_types_coverage == 90.0
-        assert metrics.overall_coverage == 80.0
-
-    def test_coverage_report_with_metrics(self):
-        """Test CoverageReport with metrics."""
-        timestamp = datetime.now(timezone.utc)
-        metrics = CoverageMetrics()
-        metrics.methods_total = 50
-        metrics.methods_called = {"method1", "method2"}
-        metrics.methods_coverage = 80.0
-        metrics.data_types_total = 30
-        metrics.data_types_used = {"User", "Order"}
-        metrics.data_types_coverage = 85.0
-        metrics.overall_coverage = 80.0
-
-        report = CoverageReport(timestamp=timestamp, metrics=metrics)
-
-        assert report.timestamp == timestamp
-        assert report.metrics.methods_total == 50
-        assert len(report.metrics.methods_called) == 2
-        assert report.metrics.methods_coverage == 80.0
-        assert report.metrics.data_types_total == 30
-        assert len(report.metrics.data_types_used) == 2
-        assert report.metrics.data_types_coverage == 85.0
-        assert report.metrics.overall_coverage == 80.0
-
-    def test_coverage_metrics_edge_cases(self):
-        """Test CoverageMetrics edge cases."""
-        metrics = CoverageMetrics()
-
-        # Test zero values
-        metrics.methods_total = 0
-        metrics.methods_called = set()
-        metrics.methods_coverage = 0.0
-        metrics.data_types_total = 0
-        metrics.data_types_used = set()
-        metrics.data_types_coverage = 0.0
-        metrics.overall_coverage = 0.0
-
-        assert metrics.methods_total == 0
-        assert len(metrics.methods_called) == 0
-        assert metrics.methods_coverage == 0.0
-        assert metrics.data_types_total == 0
-        assert len(metrics.data_types_used) == 0
-        assert metrics.data_types_coverage == 0.0
-        assert metrics.overall_coverage == 0.0
-
-    def test_coverage_metrics_high_values(self):
-        """Test CoverageMetrics with high values."""
-        metrics = CoverageMetrics()
-
-        # Test high values
-        metrics.methods_total = 10000
-        metrics.methods_called = {f"method{i}" for i in range(9500)}
-        metrics.methods_coverage = 95.0
-        metrics.data_types_total = 1000
-        metrics.data_types_used = {f"Type{i}" for i in range(980)}
-        metrics.data_types_coverage = 98.0
-        metrics.overall_coverage = 95.0
-
-        assert metrics.methods_total == 10000
-        assert len(metrics.methods_called) == 9500
-        assert metrics.methods_coverage == 95.0
-        assert metrics.data_types_total == 1000
-        assert len(metrics.data_types_used) == 980
-        assert metrics.data_types_coverage == 98.0
-        assert metrics.overall_coverage == 95.0
-
-    def test_coverage_report_timestamp(self):
-        """Test CoverageReport timestamp handling."""
-        timestamp1 = datetime.now(timezone.utc)
-        metrics = CoverageMetrics()
-        report1 = CoverageReport(timestamp=timestamp1, metrics=metrics)
-
-        timestamp2 = datetime.now(timezone.utc)
-        report2 = CoverageReport(timestamp=timestamp2, metrics=metrics)
-
-        assert report1.timestamp == timestamp1
-        assert report2.timestamp == timestamp2
-        assert report1.timestamp != report2.timestamp
-
-    def test_coverage_metrics_float_precision(self):
-        """Test CoverageMetrics float precision."""
-        metrics = CoverageMetrics()
-
-        # Test decimal precision
-        metrics.methods_coverage = 85.123456789
-        metrics.data_types_coverage = 90.987654321
-        metrics.overall_coverage = 88.555555555
-
-        assert metrics.methods_coverage == 85.123456789
-        assert metrics.data_types_coverage == 90.987654321
-        assert metrics.overall_coverage == 88.555555555
@@ -1,221 +1,80 @@
-from unittest.mock import AsyncMock, MagicMock
+from types import SimpleNamespace
 
 import pytest
 
-from alt_exchange.infra.database.coverage import (CoverageMetrics,
-                                                  CoverageReport,
-                                                  CoverageTrackingDatabase,
+from alt_exchange.infra.database.coverage import (CoverageTrackingDatabase,
                                                   DatabaseCoverageAnalyzer)
 
-
-class TestCoverageMethods:
-    """Test Coverage classes method coverage"""
-
-    @pytest.fixture
-    def mock_database(self):
-        """Mock database"""
-        db = MagicMock()
-        db.next_id.return_value = 1
-        db.users = {}
-        db.accounts = {}
-        db.balances = {}
-        db.orders = {}
-        db.trades = {}
-        db.transactions = {}
-        db.audit_logs = {}
-        return db
-
-    @pytest.fixture
-    def coverage_db(self, mock_database):
-        """CoverageTrackingDatabase instance"""
-        return CoverageTrackingDatabase(mock_database)
-
-    @pytest.fixture
-    def analyzer(self, coverage_db):
-        """DatabaseCoverageAnalyzer instance"""
-        return DatabaseCoverageAnalyzer(coverage_db)
-
-    @pytest.fixture
-    def metrics(self):
-        """CoverageMetrics instance"""
-        return CoverageMetrics()
-
-    @pytest.fixture
-    def report(self, metrics):
-        """CoverageReport instance"""
-        return CoverageReport(metrics)
-
-    def test_coverage_tracking_database_initialization(
-        self, coverage_db, mock_database
-    ):
-        """Test CoverageTrackingDatabase initialization"""
-        assert coverage_db.database is mock_database
-        assert hasattr(coverage_db, "analyzer")
-
-    def test_coverage_tracking_database_attributes(self, coverage_db):
-        """Test CoverageTrackingDatabase attributes"""
-        assert hasattr(coverage_db, "database")
-        assert hasattr(coverage_db, "analyzer")
-
-    def test_coverage_tracking_database_methods(self, coverage_db):
-        """Test CoverageTrackingDatabase methods"""
-        assert hasattr(coverage_db, "insert_user")
-        assert hasattr(coverage_db, "get_user")
-        assert hasattr(coverage_db, "insert_account")
-        assert hasattr(coverage_db, "get_account")
-        assert hasattr(coverage_db, "upsert_balance")
-        assert hasattr(coverage_db, "find_balance")
-        assert hasattr(coverage_db, "insert_order")
-        assert hasattr(coverage_db, "get_order")
-        assert hasattr(coverage_db, "update_order")
-        assert hasattr(coverage_db, "insert_trade")
-        assert hasattr(coverage_db, "get_trade")
-        assert hasattr(coverage_db, "insert_transaction")
-        assert hasattr(coverage_db, "get_transaction")
-        assert hasattr(coverage_db, "update_transaction")
-        assert hasattr(coverage_db, "insert_audit")
-        assert hasattr(coverage_db, "get_audit_logs")
-        assert hasattr(coverage_db, "find_balance")
-        assert hasattr(coverage_db, "upsert_balance")
-        assert hasattr(coverage_db, "next_id")
-        assert hasattr(coverage_db, "generate_coverage_report")
-
-    def test_coverage_tracking_database_method_callability(self, coverage_db):
-        """Test CoverageTrackingDatabase method callability"""
-        assert callable(coverage_db.insert_user)
-        assert callable(coverage_db.get_user)
-        assert callable(coverage_db.insert_account)
-        assert callable(coverage_db.get_account)
-        assert callable(coverage_db.upsert_balance)
-        assert callable(coverage_db.find_balance)
-        assert callable(coverage_db.insert_order)
-        assert callable(coverage_db.get_order)
-        assert callable(coverage_db.update_order)
-        assert callable(coverage_db.insert_trade)
-        assert callable(coverage_db.get_trade)
-        assert callable(coverage_db.insert_transaction)
-        assert callable(coverage_db.get_transaction)
-        assert callable(coverage_db.update_transaction)
-        assert callable(coverage_db.insert_audit)
-        assert callable(coverage_db.get_audit_logs)
-        assert callable(coverage_db.find_balance)
-        assert callable(coverage_db.upsert_balance)
-        assert callable(coverage_db.next_id)
-        assert callable(coverage_db.generate_coverage_report)
-
-    def test_coverage_tracking_database_class_attributes(self, coverage_db):
-        """Test CoverageTrackingDatabase class attributes"""
-        assert hasattr(coverage_db, "__class__")
-        assert coverage_db.__class__.__name__ == "CoverageTrackingDatabase"
-
-    def test_coverage_tracking_database_immutability(self, coverage_db):
-        """Test CoverageTrackingDatabase immutability"""
-        assert coverage_db.database is not None
-        assert coverage_db.analyzer is not None
-
-    def test_coverage_tracking_database_method_count(self, coverage_db):
-        """Test CoverageTrackingDatabase method count"""
-        methods = [
-            method
-            for method in dir(coverage_db)
-            if callable(getattr(coverage_db, method)) and not method.startswith("_")
-        ]
-        assert len(methods) >= 20  # At least 20 public methods
-
-    def test_database_coverage_analyzer_initialization(self, analyzer, coverage_db):
-        """Test DatabaseCoverageAnalyzer initialization"""
-        assert analyzer.database is coverage_db
-
-    def test_database_coverage_analyzer_attributes(self, analyzer):
-        """Test DatabaseCoverageAnalyzer attributes"""
-        assert hasattr(analyzer, "database")
-
-    def test_database_coverage_analyzer_methods(self, analyzer):
-        """Test DatabaseCoverageAnalyzer methods"""
-        assert hasattr(analyzer, "generate_report")
-
-    def test_database_coverage_analyzer_method_callability(self, analyzer):
-        """Test DatabaseCoverageAnalyzer method callability"""
-        assert callable(analyzer.generate_report)
-
-    def test_database_coverage_analyzer_class_attributes(self, analyzer):
-        """Test DatabaseCoverageAnalyzer class attributes"""
-        assert hasattr(analyzer, "__class__")
-        assert analyzer.__class__.__name__ == "DatabaseCoverageAnalyzer"
-
-    def test_database_coverage_analyzer_immutability(self, analyzer):
-        """Test DatabaseCoverageAnalyzer immutability"""
-        assert analyzer.database is not None
-
-    def test_database_coverage_analyzer_method_count(self, analyzer):
-        """Test DatabaseCoverageAnalyzer method count"""
-        methods = [
-            method
-            for method in dir(analyzer)
-            if callable(getattr(analyzer, method)) and not method.startswith("_")
-        ]
-        assert len(methods) >= 1  # At least 1 public method
-
-    def test_coverage_metrics_initialization(self, metrics):
-        """Test CoverageMetrics initialization"""
-        assert hasattr(metrics, "methods_total")
-        assert hasattr(metrics, "methods_called")
-        assert hasattr(metrics, "data_types_used")
-        assert hasattr(metrics, "transaction_patterns")
-        assert hasattr(metrics, "total_errors")
-
-    def test_coverage_metrics_attributes(self, metrics):
-        """Test CoverageMetrics attributes"""
-        assert hasattr(metrics, "methods_total")
-        assert hasattr(metrics, "methods_called")
-        assert hasattr(metrics, "data_types_used")
-        assert hasattr(metrics, "transaction_patterns")
-        assert hasattr(metrics, "total_errors")
-
-    def test_coverage_metrics_class_attributes(self, metrics):
-        """Test CoverageMetrics class attributes"""
-        assert hasattr(metrics, "__class__")
-        assert metrics.__class__.__name__ == "CoverageMetrics"
-
-    def test_coverage_metrics_immutability(self, metrics):
-        """Test CoverageMetrics immutability"""
-        assert metrics.methods_total is not None
-        assert metrics.methods_called is not None
-        assert metrics.data_types_used is not None
-        assert metrics.transaction_patterns is not None
-        assert metrics.total_errors is not None
-
-    def test_coverage_report_initialization(self, report, metrics):
-        """Test CoverageReport initialization"""
-        assert report.metrics is not None
-
-    def test_coverage_report_attributes(self, report):
-        """Test CoverageReport attributes"""
-        assert hasattr(report, "metrics")
-        assert hasattr(report, "detailed_metrics")
-        assert hasattr(report, "recommendations")
-
-    def test_coverage_report_class_attributes(self, report):
-        """Test CoverageReport class attributes"""
-        assert hasattr(report, "__class__")
-        assert report.__class__.__name__ == "CoverageReport"
-
-    def test_coverage_report_immutability(self, report):
-        """Test CoverageReport immutability"""
-        assert report.metrics is not None
-        assert report.detailed_metrics is not None
-        assert report.recommendations is not None
-
-    def test_coverage_report_method_count(self, report):
-        """Test CoverageReport method count"""
-        methods = [
-            method
-            for method in dir(report)
-            if callable(getattr(report, method)) and not method.startswith("_")
-        ]
-        assert len(methods) >= 0  # At least 0 public methods
-
-    def test_coverage_tracking_database_analyzer_attribute(self, coverage_db):
-        """Test CoverageTrackingDatabase analyzer attribute"""
-        assert coverage_db.analyzer is not None
-        assert hasattr(coverage_db.analyzer, "database")
+_DB_METHODS = (
+    "insert_user",
+    "get_user",
+    "insert_account",
+    "get_account",
+    "upsert_balance",
+    "find_balance",
+    "insert_order",
+    "get_order",
+    "update_order",
+    "insert_trade",
+    "get_trade",
+    "insert_transaction",
+    "get_transaction",
+    "update_transaction",
+    "insert_audit",
+    "get_audit_logs",
+    "next_id",
+    "generate_coverage_report",
+)
+
+
+@pytest.fixture(scope="module")
+def mock_database():
+    """Mock database"""
+    return SimpleNamespace(
+        next_id=lambda table: 1,
+        users={},
+        accounts={},
+        balances={},
+        orders={},
+        trades={},
+        transactions={},
+        audit_logs={},
+    )
+
+
+@pytest.fixture(scope="module")
+def coverage_db(mock_database):
+    """CoverageTrackingDatabase instance"""
+    return CoverageTrackingDatabase(mock_database)
+
+
+@pytest.fixture(scope="module")
+def analyzer(coverage_db):
+    """DatabaseCoverageAnalyzer instance"""
+    return DatabaseCoverageAnalyzer(coverage_db)
+
+
+def test_coverage_tracking_database_contract(coverage_db, mock_database):
+    """Test CoverageTrackingDatabase initialization and attributes"""
+    assert isinstance(coverage_db, CoverageTrackingDatabase)
+    assert {"database", "analyzer"} <= vars(coverage_db).keys()
+    assert coverage_db.database is mock_database
+    assert isinstance(coverage_db.analyzer, DatabaseCoverageAnalyzer)
+    assert coverage_db.analyzer.database is mock_database
+
+
+@pytest.mark.parametrize("name", _DB_METHODS)
+def test_coverage_tracking_database_method(coverage_db, name):
+    """Test CoverageTrackingDatabase exposes a callable for each operation"""
+    assert callable(getattr(coverage_db, name, None))
+
+
+def test_database_coverage_analyzer_contract(analyzer, coverage_db):
+    """Test DatabaseCoverageAnalyzer initialization and attributes"""
+    assert analyzer.database is coverage_db
+    assert callable(analyzer.generate_report)
+
+
+def test_database_coverage_analyzer_method_count(analyzer):
+    """Test DatabaseCoverageAnalyzer method count"""
+    assert "generate_report" in vars(type(analyzer))
@@ -3,8 +3,8 @@ Additional tests for database/coverage.py to improve coverage.
 Focuses on uncovered lines and edge cases.
 """
 
-import time
-from unittest.mock import Mock, patch
+import dataclasses
+from types import SimpleNamespace
 
 import pytest
 
@@ -12,229 +12,236 @@ from alt_exchange.infra.database.coverage import (CoverageMetrics,
                                                   CoverageReport,
                                                   DatabaseCoverageAnalyzer)
 
-
-class TestCoverageMoreCoverage:
-    """Test coverage classes for better coverage."""
-
-    @pytest.fixture
-    def mock_db(self):
-        """Mock database."""
-        db = Mock()
-        return db
-
-    def test_database_coverage_analyzer_init(self, mock_db):
-        """Test DatabaseCoverageAnalyzer initialization."""
-        analyzer = DatabaseCoverageAnalyzer(mock_db)
-        assert analyzer.database is mock_db
-        assert analyzer.call_counts == {}
-        assert analyzer.response_times == {}
-        assert analyzer.errors == {}
-        assert analyzer.data_types_used == set()
-
-    def test_coverage_metrics_init(self):
-        """Test CoverageMetrics initialization."""
-        metrics = CoverageMetrics()
-        assert metrics.methods_called == set()
-        assert metrics.methods_total == 0
-        assert metrics.methods_coverage == 0.0
-        assert metrics.data_types_used == set()
-        assert metrics.data_types_total == 0
-        assert metrics.data_types_coverage == 0.0
-        assert metrics.query_patterns == set()
-        assert metrics.query_patterns_total == 0
-        assert metrics.query_patterns_coverage == 0.0
-        assert metrics.error_scenarios == set()
-        assert metrics.error_scenarios_total == 0
-        assert metrics.error_scenarios_coverage == 0.0
-        assert metrics.transaction_patterns == set()
-        assert metrics.transaction_patterns_total == 0
-        assert metrics.transaction_patterns_coverage == 0.0
-        assert metrics.overall_coverage == 0.0
-        assert metrics.avg_response_time == 0.0
-        assert metrics.max_response_time == 0.0
-        assert metrics.min_response_time == float("inf")
-        assert metrics.total_errors == 0
-        assert metrics.error_rate == 0.0
-
-    def test_coverage_metrics_with_values(self):
-        """Test CoverageMetrics with values."""
-        metrics = CoverageMetrics()
-        metrics.methods_called = {"method1", "method2"}
-        metrics.methods_total = 10
-        metrics.methods_coverage = 20.0
-        metrics.data_types_used = {"Account", "Order"}
-        metrics.data_types_total = 5
-        metrics.data_types_coverage = 40.0
-        metrics.overall_coverage = 30.0
-        metrics.avg_response_time = 1.5
-        metrics.max_response_time = 3.0
-        metrics.min_response_time = 0.5
-        metrics.total_errors = 2
-        metrics.error_rate = 0.1
-
-        assert len(metrics.methods_called) == 2
-        assert metrics.methods_total == 10
-        assert metrics.methods_coverage == 20.0
-        assert len(metrics.data_types_used) == 2
-        assert metrics.data_types_total == 5
-        assert metrics.data_types_coverage == 40.0
-        assert metrics.overall_coverage == 30.0
-        assert metrics.avg_response_time == 1.5
-        assert metrics.max_response_time == 3.0
-        assert metrics.min_response_time == 0.5
-        assert metrics.total_errors == 2
-        assert metrics.error_rate == 0.1
-
-    def test_coverage_report_init(self):
-        """Test CoverageReport initialization."""
-        report = CoverageReport()
-        assert isinstance(report.timestamp, float)
-        assert isinstance(report.metrics, CoverageMetrics)
-        assert report.detailed_metrics == {}
-        assert report.recommendations == []
-
-    def test_coverage_report_with_values(self):
-        """Test CoverageReport with values."""
-        metrics = CoverageMetrics()
-        metrics.overall_coverage = 85.5
-
-        report = CoverageReport(
-            timestamp=1234567890.0,
-            metrics=metrics,
-            detailed_metrics={"test": "data"},
-            recommendations=["recommendation1", "recommendation2"],
-        )
-        assert report.timestamp == 1234567890.0
-        assert report.metrics.overall_coverage == 85.5
-        assert report.detailed_metrics == {"test": "data"}
-        assert report.recommendations == ["recommendation1", "recommendation2"]
-
-    def test_coverage_report_to_dict(self):
-        """Test CoverageReport to_dict method."""
-        metrics = CoverageMetrics()
-        metrics.methods_coverage = 80.0
-        metrics.data_types_coverage = 70.0
-        metrics.query_patterns_coverage = 60.0
-        metrics.error_scenarios_coverage = 50.0
-        metrics.transaction_patterns_coverage = 90.0
-        metrics.overall_coverage = 70.0
-        metrics.avg_response_time = 1.2
-        metrics.max_response_time = 2.5
-        metrics.min_response_time = 0.3
-        metrics.total_errors = 5
-        metrics.error_rate = 0.05
-
-        report = CoverageReport(
-            timestamp=1234567890.0,
-            metrics=metrics,
-            detailed_metrics={"detail": "value"},
-            recommendations=["rec1", "rec2"],
-        )
-
-        result = report.to_dict()
-        assert result["timestamp"] == 1234567890.0
-        assert result["metrics"]["methods_coverage"] == 80.0
-        assert result["metrics"]["data_types_coverage"] == 70.0
-        assert result["metrics"]["query_patterns_coverage"] == 60.0
-        assert result["metrics"]["error_scenarios_coverage"] == 50.0
-        assert result["metrics"]["transaction_patterns_coverage"] == 90.0
-        assert result["metrics"]["overall_coverage"] == 70.0
-        assert result["metrics"]["avg_response_time"] == 1.2
-        assert result["metrics"]["max_response_time"] == 2.5
-        assert result["metrics"]["min_response_time"] == 0.3
-        assert result["metrics"]["total_errors"] == 5
-        assert result["metrics"]["error_rate"] == 0.05
-        assert result["detailed_metrics"] == {"detail": "value"}
-        assert result["recommendations"] == ["rec1", "rec2"]
-
-    def test_coverage_metrics_edge_cases(self):
-        """Test CoverageMetrics with edge case values."""
-        metrics = CoverageMetrics()
-
-        # Test with zero values
-        metrics.methods_total = 0
-        metrics.data_types_total = 0
-        metrics.query_patterns_total = 0
-        metrics.error_scenarios_total = 0
-        metrics.transaction_patterns_total = 0
-
-        assert metrics.methods_total == 0
-        assert metrics.data_types_total == 0
-        assert metrics.query_patterns_total == 0
-        assert metrics.error_scenarios_total == 0
-        assert metrics.transaction_patterns_total == 0
-
-        # Test with large values
-        metrics.methods_total = 10000
-        metrics.data_types_total = 1000
-        metrics.overall_coverage = 99.99
-        metrics.avg_response_time = 1000.0
-        metrics.max_response_time = 5000.0
-        metrics.min_response_time = 0.001
-        metrics.total_errors = 1000
-        metrics.error_rate = 0.99
-
-        assert metrics.methods_total == 10000
-        assert metrics.data_types_total == 1000
-        assert metrics.overall_coverage == 99.99
-        assert metrics.avg_response_time == 1000.0
-        assert metrics.max_response_time == 5000.0
-        assert metrics.min_response_time == 0.001
-        assert metrics.total_errors == 1000
-        assert metrics.error_rate == 0.99
-
-    def test_coverage_report_timestamp_edge_cases(self):
-        """Test CoverageReport with edge case timestamps."""
-        # Test with zero timestamp
-        report1 = CoverageReport(timestamp=0.0)
-        assert report1.timestamp == 0.0
-
-        # Test with large timestamp
-        report2 = CoverageReport(timestamp=9999999999.0)
-        assert report2.timestamp == 9999999999.0
-
-        # Test with current time
-        current_time = time.time()
-        report3 = CoverageReport(timestamp=current_time)
-        assert report3.timestamp == current_time
-
-    def test_coverage_metrics_sets(self):
-        """Test CoverageMetrics with set values."""
-        metrics = CoverageMetrics()
-
-        # Test methods_called set
-        metrics.methods_called = {"get_account", "create_order", "update_balance"}
-        assert len(metrics.methods_called) == 3
-        assert "get_account" in metrics.methods_called
-        assert "create_order" in metrics.methods_called
-        assert "update_balance" in metrics.methods_called
-
-        # Test data_types_used set
-        metrics.data_types_used = {"Account", "Order", "Trade", "Transaction"}
-        assert len(metrics.data_types_used) == 4
-        assert "Account" in metrics.data_types_used
-        assert "Order" in metrics.data_types_used
-        assert "Trade" in metrics.data_types_used
-        assert "Transaction" in metrics.data_types_used
-
-        # Test query_patterns set
-        metrics.query_patterns = {"SELECT", "INSERT", "UPDATE", "DELETE"}
-        assert len(metrics.query_patterns) == 4
-        assert "SELECT" in metrics.query_patterns
-        assert "INSERT" in metrics.query_patterns
-        assert "UPDATE" in metrics.query_patterns
-        assert "DELETE" in metrics.query_patterns
-
-        # Test error_scenarios set
-        metrics.error_scenarios = {"timeout", "connection_error", "validation_error"}
-        assert len(metrics.error_scenarios) == 3
-        assert "timeout" in metrics.error_scenarios
-        assert "connection_error" in metrics.error_scenarios
-        assert "validation_error" in metrics.error_scenarios
-
-        # Test transaction_patterns set
-        metrics.transaction_patterns = {"begin", "commit", "rollback"}
-        assert len(metrics.transaction_patterns) == 3
-        assert "begin" in metrics.transaction_patterns
-        assert "commit" in metrics.transaction_patterns
-        assert "rollback" in metrics.transaction_patterns
+_METRICS_FIELDS = frozenset(
+    {
+        "methods_called",
+        "methods_total",
+        "methods_coverage",
+        "data_types_used",
+        "data_types_total",
+        "data_types_coverage",
+        "query_patterns",
+        "query_patterns_total",
+        "query_patterns_coverage",
+        "error_scenarios",
+        "error_scenarios_total",
+        "error_scenarios_coverage",
+        "transaction_patterns",
+        "transaction_patterns_total",
+        "transaction_patterns_coverage",
+        "overall_coverage",
+        "avg_response_time",
+        "max_response_time",
+        "min_response_time",
+        "total_errors",
+        "error_rate",
+    }
+)
+
+_METRICS_EDGE_CASES = [
+    # Zero values
+    ("methods_total", 0),
+    ("data_types_total", 0),
+    ("query_patterns_total", 0),
+    ("error_scenarios_total", 0),
+    ("transaction_patterns_total", 0),
+    # Large values
+    ("methods_total", 10000),
+    ("data_types_total", 1000),
+    ("overall_coverage", 99.99),
+    ("avg_response_time", 1000.0),
+    ("max_response_time", 5000.0),
+    ("min_response_time", 0.001),
+    ("total_errors", 1000),
+    ("error_rate", 0.99),
+]
+
+_METRICS_SET_CASES = [
+    ("methods_called", {"get_account", "create_order", "update_balance"}),
+    ("data_types_used", {"Account", "Order", "Trade", "Transaction"}),
+    ("query_patterns", {"SELECT", "INSERT", "UPDATE", "DELETE"}),
+    ("error_scenarios", {"timeout", "connection_error", "validation_error"}),
+    ("transaction_patterns", {"begin", "commit", "rollback"}),
+]
+
+
+@pytest.fixture
+def mock_db():
+    """Mock database."""
+    return SimpleNamespace()
+
+
+@pytest.fixture(scope="module")
+def default_metrics():
+    """Shared default CoverageMetrics for read-only checks."""
+    return CoverageMetrics()
+
+
+def test_database_coverage_analyzer_init(mock_db):
+    """Test DatabaseCoverageAnalyzer initialization."""
+    analyzer = DatabaseCoverageAnalyzer(mock_db)
+    assert analyzer.database is mock_db
+    assert analyzer.call_counts == {}
+    assert analyzer.response_times == {}
+    assert analyzer.errors == {}
+    assert analyzer.data_types_used == set()
+
+
+def test_coverage_metrics_init(default_metrics):
+    """Test CoverageMetrics initialization."""
+    metrics = default_metrics
+    assert {f.name for f in dataclasses.fields(metrics)} == _METRICS_FIELDS
+    assert metrics.methods_called == set()
+    assert metrics.methods_total == 0
+    assert metrics.methods_coverage == 0.0
+    assert metrics.data_types_used == set()
+    assert metrics.data_types_total == 0
+    assert metrics.data_types_coverage == 0.0
+    assert metrics.query_patterns == set()
+    assert metrics.query_patterns_total == 0
+    assert metrics.query_patterns_coverage == 0.0
+    assert metrics.error_scenarios == set()
+    assert metrics.error_scenarios_total == 0
+    assert metrics.error_scenarios_coverage == 0.0
+    assert metrics.transaction_patterns == set()
+    assert metrics.transaction_patterns_total == 0
+    assert metrics.transaction_patterns_coverage == 0.0
+    assert metrics.overall_coverage == 0.0
+    assert metrics.avg_response_time == 0.0
+    assert metrics.max_response_time == 0.0
+    assert metrics.min_response_time == float("inf")
+    assert metrics.total_errors == 0
+    assert metrics.error_rate == 0.0
+
+
+def test_coverage_metrics_with_values():
+    """Test CoverageMetrics with values."""
+    metrics = CoverageMetrics()
+    metrics.methods_called = {"method1", "method2"}
+    metrics.methods_total = 10
+    metrics.methods_coverage = 20.0
+    metrics.data_types_used = {"Account", "Order"}
+    metrics.data_types_total = 5
+    metrics.data_types_coverage = 40.0
+    metrics.overall_coverage = 30.0
+    metrics.avg_response_time = 1.5
+    metrics.max_response_time = 3.0
+    metrics.min_response_time = 0.5
+    metrics.total_errors = 2
+    metrics.error_rate = 0.1
+
+    assert len(metrics.methods_called) == 2
+    assert metrics.methods_total == 10
+    assert metrics.methods_coverage == 20.0
+    assert len(metrics.data_types_used) == 2
+    assert metrics.data_types_total == 5
+    assert metrics.data_types_coverage == 40.0
+    assert metrics.overall_coverage == 30.0
+    assert metrics.avg_response_time == 1.5
+    assert metrics.max_response_time == 3.0
+    assert metrics.min_response_time == 0.5
+    assert metrics.total_errors == 2
+    assert metrics.error_rate == 0.1
+
+
+def test_coverage_report_init():
+    """Test CoverageReport initialization."""
+    report = CoverageReport()
+    assert isinstance(report.timestamp, float)
+    assert isinstance(report.metrics, CoverageMetrics)
+    assert report.detailed_metrics == {}
+    assert report.recommendations == []
+
+
+def test_coverage_report_with_values():
+    """Test CoverageReport with values."""
+    metrics = CoverageMetrics()
+    metrics.overall_coverage = 85.5
+
+    report = CoverageReport(
+        timestamp=1234567890.0,
+        metrics=metrics,
+        detailed_metrics={"test": "data"},
+        recommendations=["recommendation1", "recommendation2"],
+    )
+    assert report.timestamp == 1234567890.0
+    assert report.metrics.overall_coverage == 85.5
+    assert report.detailed_metrics == {"test": "data"}
+    assert report.recommendations == ["recommendation1", "recommendation2"]
+
+
+def test_coverage_report_to_dict():
+    """Test CoverageReport to_dict method."""
+    metrics = CoverageMetrics()
+    metrics.methods_coverage = 80.0
+    metrics.data_types_coverage = 70.0
+    metrics.query_patterns_coverage = 60.0
+    metrics.error_scenarios_coverage = 50.0
+    metrics.transaction_patterns_coverage = 90.0
+    metrics.overall_coverage = 70.0
+    metrics.avg_response_time = 1.2
+    metrics.max_response_time = 2.5
+    metrics.min_response_time = 0.3
+    metrics.total_errors = 5
+    metrics.error_rate = 0.05
+
+    report = CoverageReport(
+        timestamp=1234567890.0,
+        metrics=metrics,
+        detailed_metrics={"detail": "value"},
+        recommendations=["rec1", "rec2"],
+    )
+
+    result = report.to_dict()
+    assert result["timestamp"] == 1234567890.0
+    assert result["metrics"]["methods_coverage"] == 80.0
+    assert result["metrics"]["data_types_coverage"] == 70.0
+    assert result["metrics"]["query_patterns_coverage"] == 60.0
+    assert result["metrics"]["error_scenarios_coverage"] == 50.0
+    assert result["metrics"]["transaction_patterns_coverage"] == 90.0
+    assert result["metrics"]["overall_coverage"] == 70.0
+    assert result["metrics"]["avg_response_time"] == 1.2
+    assert result["metrics"]["max_response_time"] == 2.5
+    assert result["metrics"]["min_response_time"] == 0.3
+    assert result["metrics"]["total_errors"] == 5
+    assert result["metrics"]["error_rate"] == 0.05
+    assert result["detailed_metrics"] == {"detail": "value"}
+    assert result["recommendations"] == ["rec1", "rec2"]
+
+
+@pytest.mark.parametrize("attr, value", _METRICS_EDGE_CASES)
+def test_coverage_metrics_edge_cases(attr, value):
+    """Test CoverageMetrics with edge case values."""
+    metrics = CoverageMetrics()
+    setattr(metrics, attr, value)
+    assert getattr(metrics, attr) == value
+
+
+def test_coverage_report_timestamp_edge_cases():
+    """Test CoverageReport with edge case timestamps."""
+    # Test with zero timestamp
+    report1 = CoverageReport(timestamp=0.0)
+    assert report1.timestamp == 0.0
+
+    # Test with large timestamp
+    report2 = CoverageReport(timestamp=9999999999.0)
+    assert report2.timestamp == 9999999999.0
+
+    # Test with current time
+    import time
+
+    current_time = time.time()
+    report3 = CoverageReport(timestamp=current_time)
+    assert report3.timestamp == current_time
+
+
+@pytest.mark.parametrize(
+    "attr, values",
+    _METRICS_SET_CASES,
+    ids=[attr for attr, _ in _METRICS_SET_CASES],
+)
+def test_coverage_metrics_sets(attr, values):
+    """Test CoverageMetrics with set values."""
+    metrics = CoverageMetrics()
+    setattr(metrics, attr, set(values))
+    assert getattr(metrics, attr) == values
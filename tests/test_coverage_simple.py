@@ -1,5 +1,7 @@
 """Simple tests for coverage.py to improve coverage"""
 
+import inspect
+from functools import lru_cache
 from unittest.mock import MagicMock
 
 import pytest
@@ -9,24 +11,78 @@ from alt_exchange.infra.database.coverage import (CoverageMetrics,
                                                   CoverageTrackingDatabase,
                                                   DatabaseCoverageAnalyzer)
 
+pytestmark = pytest.mark.smoke
+
+# Key on class functions only; bound methods would keep fixture objects alive
+_sig = lru_cache(maxsize=None)(inspect.signature)
+
+# Shared call arguments; the wrapped database is a MagicMock and ignores them
+_SENTINEL = MagicMock()
+_SENTINEL2 = MagicMock()
+
+COVERAGE_DB_METHODS = (
+    "insert_user",
+    "get_user",
+    "insert_account",
+    "get_account",
+    "upsert_balance",
+    "find_balance",
+    "insert_order",
+    "get_order",
+    "insert_trade",
+    "get_trade",
+    "insert_transaction",
+    "get_transaction",
+)
+
+COVERAGE_METRICS_ATTRS = (
+    "methods_called",
+    "methods_total",
+    "methods_coverage",
+    "data_types_used",
+    "data_types_total",
+    "data_types_coverage",
+    "query_patterns",
+    "query_patterns_total",
+    "query_patterns_coverage",
+    "error_scenarios",
+    "error_scenarios_total",
+    "error_scenarios_coverage",
+    "transaction_patterns",
+    "transaction_patterns_total",
+    "transaction_patterns_coverage",
+    "overall_coverage",
+    "avg_response_time",
+    "max_response_time",
+    "min_response_time",
+    "total_errors",
+    "error_rate",
+)
+
 
 class TestCoverageSimple:
     """Simple tests for coverage.py coverage improvement"""
 
-    @pytest.fixture
+    @pytest.fixture(scope="module")
     def mock_database(self):
         """Mock database"""
         return MagicMock()
 
-    @pytest.fixture
+    @pytest.fixture(scope="module")
     def coverage_db(self, mock_database):
         """CoverageTrackingDatabase instance"""
         return CoverageTrackingDatabase(mock_database)
 
+    @pytest.fixture
+    def coverage_db_fresh(self):
+        """CoverageTrackingDatabase instance for tests that call through it"""
+        return CoverageTrackingDatabase(MagicMock())
+
     def test_coverage_tracking_database_initialization(
         self, coverage_db, mock_database
     ):
         """Test CoverageTrackingDatabase initialization"""
+        assert isinstance(coverage_db, CoverageTrackingDatabase)
         assert coverage_db.database is mock_database
 
     def test_coverage_tracking_database_attributes(self, coverage_db):
@@ -34,35 +90,13 @@ class TestCoverageSimple:
         assert hasattr(coverage_db, "database")
         assert coverage_db.database is not None
 
-    def test_coverage_tracking_database_methods(self, coverage_db):
-        """Test CoverageTrackingDatabase methods"""
-        assert hasattr(coverage_db, "insert_user")
-        assert hasattr(coverage_db, "get_user")
-        assert hasattr(coverage_db, "insert_account")
-        assert hasattr(coverage_db, "get_account")
-        assert hasattr(coverage_db, "upsert_balance")
-        assert hasattr(coverage_db, "find_balance")
-        assert hasattr(coverage_db, "insert_order")
-        assert hasattr(coverage_db, "get_order")
-        assert hasattr(coverage_db, "insert_trade")
-        assert hasattr(coverage_db, "get_trade")
-        assert hasattr(coverage_db, "insert_transaction")
-        assert hasattr(coverage_db, "get_transaction")
-
-    def test_coverage_tracking_database_method_callability(self, coverage_db):
-        """Test CoverageTrackingDatabase method callability"""
-        assert callable(coverage_db.insert_user)
-        assert callable(coverage_db.get_user)
-        assert callable(coverage_db.insert_account)
-        assert callable(coverage_db.get_account)
-        assert callable(coverage_db.upsert_balance)
-        assert callable(coverage_db.find_balance)
-        assert callable(coverage_db.insert_order)
-        assert callable(coverage_db.get_order)
-        assert callable(coverage_db.insert_trade)
-        assert callable(coverage_db.get_trade)
-        assert callable(coverage_db.insert_transaction)
-        assert callable(coverage_db.get_transaction)
+    @pytest.mark.parametrize("name", COVERAGE_DB_METHODS)
+    def test_coverage_tracking_database_method(self, coverage_db_fresh, name):
+        """Test CoverageTrackingDatabase methods are callable and return results"""
+        method = getattr(coverage_db_fresh, name)
+        assert callable(method)
+        args = (_SENTINEL, _SENTINEL2) if name == "find_balance" else (_SENTINEL,)
+        assert method(*args) is not None
 
     def test_database_coverage_analyzer_initialization(self, coverage_db):
         """Test DatabaseCoverageAnalyzer initialization"""
@@ -80,30 +114,11 @@ class TestCoverageSimple:
         metrics = CoverageMetrics()
         assert metrics is not None
 
-    def test_coverage_metrics_attributes(self):
+    @pytest.mark.parametrize("name", COVERAGE_METRICS_ATTRS)
+    def test_coverage_metrics_attribute(self, name):
         """Test CoverageMetrics attributes"""
         metrics = CoverageMetrics()
-        assert hasattr(metrics, "methods_called")
-        assert hasattr(metrics, "methods_total")
-        assert hasattr(metrics, "methods_coverage")
-        assert hasattr(metrics, "data_types_used")
-        assert hasattr(metrics, "data_types_total")
-        assert hasattr(metrics, "data_types_coverage")
-        assert hasattr(metrics, "query_patterns")
-        assert hasattr(metrics, "query_patterns_total")
-        assert hasattr(metrics, "query_patterns_coverage")
-        assert hasattr(metrics, "error_scenarios")
-        assert hasattr(metrics, "error_scenarios_total")
-        assert hasattr(metrics, "error_scenarios_coverage")
-        assert hasattr(metrics, "transaction_patterns")
-        assert hasattr(metrics, "transaction_patterns_total")
-        assert hasattr(metrics, "transaction_patterns_coverage")
-        assert hasattr(metrics, "overall_coverage")
-        assert hasattr(metrics, "avg_response_time")
-        assert hasattr(metrics, "max_response_time")
-        assert hasattr(metrics, "min_response_time")
-        assert hasattr(metrics, "total_errors")
-        assert hasattr(metrics, "error_rate")
+        assert getattr(metrics, name) is not None
 
     def test_coverage_report_initialization(self):
         """Test CoverageReport initialization"""
@@ -113,60 +128,6 @@ class TestCoverageSimple:
     def test_coverage_report_attributes(self):
         """Test CoverageReport attributes"""
         report = CoverageReport()
-        assert hasattr(report, "timestamp")
-        assert hasattr(report, "metrics")
-        assert hasattr(report, "detailed_metrics")
-        assert hasattr(report, "recommendations")
-
-    def test_coverage_tracking_database_class_attributes(self, coverage_db):
-        """Test CoverageTrackingDatabase class attributes"""
-        assert hasattr(coverage_db, "__class__")
-        assert coverage_db.__class__.__name__ == "CoverageTrackingDatabase"
-
-    def test_database_coverage_analyzer_class_attributes(self, coverage_db):
-        """Test DatabaseCoverageAnalyzer class attributes"""
-        analyzer = DatabaseCoverageAnalyzer(coverage_db)
-        assert hasattr(analyzer, "__class__")
-        assert analyzer.__class__.__name__ == "DatabaseCoverageAnalyzer"
-
-    def test_coverage_metrics_class_attributes(self):
-        """Test CoverageMetrics class attributes"""
-        metrics = CoverageMetrics()
-        assert hasattr(metrics, "__class__")
-        assert metrics.__class__.__name__ == "CoverageMetrics"
-
-    def test_coverage_report_class_attributes(self):
-        """Test CoverageReport class attributes"""
-        report = CoverageReport()
-        assert hasattr(report, "__class__")
-        assert report.__class__.__name__ == "CoverageReport"
-
-    def test_coverage_tracking_database_immutability(self, coverage_db):
-        """Test CoverageTrackingDatabase immutability"""
-        assert coverage_db.database is not None
-        assert callable(coverage_db.insert_user)
-        assert callable(coverage_db.get_user)
-        assert callable(coverage_db.insert_account)
-        assert callable(coverage_db.get_account)
-
-    def test_database_coverage_analyzer_immutability(self, coverage_db):
-        """Test DatabaseCoverageAnalyzer immutability"""
-        analyzer = DatabaseCoverageAnalyzer(coverage_db)
-        assert analyzer.database is not None
-
-    def test_coverage_metrics_immutability(self):
-        """Test CoverageMetrics immutability"""
-        metrics = CoverageMetrics()
-        assert metrics.methods_called is not None
-        assert metrics.methods_total is not None
-        assert metrics.methods_coverage is not None
-        assert metrics.data_types_used is not None
-        assert metrics.data_types_total is not None
-        assert metrics.data_types_coverage is not None
-
-    def test_coverage_report_immutability(self):
-        """Test CoverageReport immutability"""
-        report = CoverageReport()
         assert report.timestamp is not None
         assert report.metrics is not None
         assert report.detailed_metrics is not None
@@ -174,97 +135,33 @@ class TestCoverageSimple:
 
     def test_coverage_tracking_database_method_count(self, coverage_db):
         """Test CoverageTrackingDatabase method count"""
-        methods = [
-            method
-            for method in dir(coverage_db)
-            if callable(getattr(coverage_db, method)) and not method.startswith("_")
-        ]
-        assert len(methods) >= 12  # At least 12 public methods
-
-    def test_database_coverage_analyzer_method_count(self, coverage_db):
-        """Test DatabaseCoverageAnalyzer method count"""
-        analyzer = DatabaseCoverageAnalyzer(coverage_db)
-        methods = [
-            method
-            for method in dir(analyzer)
-            if callable(getattr(analyzer, method)) and not method.startswith("_")
-        ]
-        assert len(methods) >= 0  # At least 0 public methods
-
-    def test_coverage_metrics_method_count(self):
-        """Test CoverageMetrics method count"""
-        metrics = CoverageMetrics()
-        methods = [
-            method
-            for method in dir(metrics)
-            if callable(getattr(metrics, method)) and not method.startswith("_")
-        ]
-        assert len(methods) >= 0  # At least 0 public methods
-
-    def test_coverage_report_method_count(self):
-        """Test CoverageReport method count"""
-        report = CoverageReport()
-        methods = [
-            method
-            for method in dir(report)
-            if callable(getattr(report, method)) and not method.startswith("_")
-        ]
-        assert len(methods) >= 0  # At least 0 public methods
+        public = [name for name in vars(type(coverage_db)) if not name.startswith("_")]
+        assert len(public) >= 12  # At least 12 public methods
 
     def test_coverage_tracking_database_method_signatures(self, coverage_db):
         """Test CoverageTrackingDatabase method signatures"""
-        import inspect
-
-        # Test some method signatures
-        sig = inspect.signature(coverage_db.insert_user)
-        assert len(sig.parameters) >= 1
-
-        sig = inspect.signature(coverage_db.get_user)
-        assert len(sig.parameters) >= 1
-
-        sig = inspect.signature(coverage_db.insert_account)
-        assert len(sig.parameters) >= 1
-
-        sig = inspect.signature(coverage_db.get_account)
-        assert len(sig.parameters) >= 1
-
-    def test_coverage_tracking_database_method_return_types(self, coverage_db):
+        # Signatures of the plain functions, so the cache holds no instances;
+        # each takes self plus at least one argument
+        wrapper = type(coverage_db)
+        for method in (
+            wrapper.insert_user,
+            wrapper.get_user,
+            wrapper.insert_account,
+            wrapper.get_account,
+        ):
+            assert len(_sig(method).parameters) >= 2
+
+    def test_coverage_tracking_database_method_return_types(self, coverage_db_fresh):
         """Test CoverageTrackingDatabase method return types"""
         # Test that methods return appropriate types
-        result = coverage_db.insert_user(MagicMock())
+        result = coverage_db_fresh.insert_user(_SENTINEL)
         assert result is not None
 
-        result = coverage_db.get_user(1)
+        result = coverage_db_fresh.get_user(1)
         assert result is not None
 
-        result = coverage_db.insert_account(MagicMock())
+        result = coverage_db_fresh.insert_account(_SENTINEL)
         assert result is not None
 
-        result = coverage_db.get_account(1)
+        result = coverage_db_fresh.get_account(1)
         assert result is not None
-
-    def test_coverage_tracking_database_method_consistency(self, coverage_db):
-        """Test CoverageTrackingDatabase method consistency"""
-        methods = [
-            "insert_user",
-            "get_user",
-            "insert_account",
-            "get_account",
-            "upsert_balance",
-            "find_balance",
-            "insert_order",
-            "get_order",
-            "insert_trade",
-            "get_trade",
-            "insert_transaction",
-            "get_transaction",
-        ]
-
-        for method_name in methods:
-            method = getattr(coverage_db, method_name)
-            assert callable(method)
-            if method_name == "find_balance":
-                result = method(MagicMock(), MagicMock())
-            else:
-                result = method(MagicMock())
-            assert result is not None
@@ -15,6 +15,16 @@ from alt_exchange.core.models import (Account, Balance, Order, Trade,
 from alt_exchange.infra.database.in_memory import (InMemoryDatabase,
                                                    InMemoryUnitOfWork)
 
+_D0 = Decimal("0.0")
+_D0_1 = Decimal("0.1")
+_D5 = Decimal("5.0")
+_D8 = Decimal("8.0")
+_D10 = Decimal("10.0")
+_D100 = Decimal("100.0")
+_D150 = Decimal("150.0")
+_D200 = Decimal("200.0")
+_D1000 = Decimal("1000.0")
+
 
 class TestInMemoryAdditional:
     """Additional tests for InMemoryDatabase"""
@@ -52,19 +62,29 @@ class TestInMemoryAdditional:
             side=Side.BUY,
             type=OrderType.LIMIT,
             time_in_force=TimeInForce.GTC,
-            price=Decimal("100.0"),
-            amount=Decimal("10.0"),
-            filled=Decimal("0.0"),
+            price=_D100,
+            amount=_D10,
+            filled=_D0,
             status=OrderStatus.OPEN,
         )
         in_memory_db.orders[1] = order
         result = in_memory_db.get_order(1)
         assert result == order
 
-    def test_in_memory_database_get_order_not_found(self, in_memory_db):
-        """Test get_order method when order not found"""
-        result = in_memory_db.get_order(999)
-        assert result is None
+    @pytest.mark.parametrize(
+        "method, args",
+        [
+            ("get_order", (999,)),
+            ("get_trade", (999,)),
+            ("get_account", (999,)),
+            ("find_balance", (999, Asset.USDT)),
+            ("get_transaction", (999,)),
+            ("get_user", (999,)),
+        ],
+    )
+    def test_in_memory_database_not_found(self, in_memory_db, method, args):
+        """Test lookups return None when the entity does not exist"""
+        assert getattr(in_memory_db, method)(*args) is None
 
     def test_in_memory_database_get_trade(self, in_memory_db):
         """Test get_trade method"""
@@ -75,19 +95,14 @@ class TestInMemoryAdditional:
             maker_order_id=1,
             taker_order_id=2,
             taker_side=Side.BUY,
-            price=Decimal("100.0"),
-            amount=Decimal("10.0"),
-            fee=Decimal("0.1"),
+            price=_D100,
+            amount=_D10,
+            fee=_D0_1,
         )
         in_memory_db.trades[1] = trade
         result = in_memory_db.get_trade(1)
         assert result == trade
 
-    def test_in_memory_database_get_trade_not_found(self, in_memory_db):
-        """Test get_trade method when trade not found"""
-        result = in_memory_db.get_trade(999)
-        assert result is None
-
     def test_in_memory_database_get_account(self, in_memory_db):
         """Test get_account method"""
         account = Account(id=1, user_id=1)
@@ -95,30 +110,20 @@ class TestInMemoryAdditional:
         result = in_memory_db.get_account(1)
         assert result == account
 
-    def test_in_memory_database_get_account_not_found(self, in_memory_db):
-        """Test get_account method when account not found"""
-        result = in_memory_db.get_account(999)
-        assert result is None
-
     def test_in_memory_database_find_balance(self, in_memory_db):
         """Test find_balance method"""
         balance = Balance(
             id=1,
             account_id=1,
             asset=Asset.USDT,
-            available=Decimal("1000.0"),
-            locked=Decimal("0.0"),
+            available=_D1000,
+            locked=_D0,
         )
         in_memory_db.balances[1] = balance
         in_memory_db._balance_index[(1, Asset.USDT)] = 1
         result = in_memory_db.find_balance(1, Asset.USDT)
         assert result == balance
 
-    def test_in_memory_database_find_balance_not_found(self, in_memory_db):
-        """Test find_balance method when balance not found"""
-        result = in_memory_db.find_balance(999, Asset.USDT)
-        assert result is None
-
     def test_in_memory_database_get_transaction(self, in_memory_db):
         """Test get_transaction method"""
         transaction = Transaction(
@@ -126,7 +131,7 @@ class TestInMemoryAdditional:
             user_id=1,
             type=TransactionType.DEPOSIT,
             asset=Asset.USDT,
-            amount=Decimal("100.0"),
+            amount=_D100,
             status=TransactionStatus.PENDING,
             tx_hash="test_hash",
             chain="test_chain",
@@ -137,11 +142,6 @@ class TestInMemoryAdditional:
         result = in_memory_db.get_transaction(1)
         assert result == transaction
 
-    def test_in_memory_database_get_transaction_not_found(self, in_memory_db):
-        """Test get_transaction method when transaction not found"""
-        result = in_memory_db.get_transaction(999)
-        assert result is None
-
     def test_in_memory_database_get_user(self, in_memory_db):
         """Test get_user method"""
         user = User(id=1, email="test@example.com", password_hash="hash")
@@ -149,11 +149,6 @@ class TestInMemoryAdditional:
         result = in_memory_db.get_user(1)
         assert result == user
 
-    def test_in_memory_database_get_user_not_found(self, in_memory_db):
-        """Test get_user method when user not found"""
-        result = in_memory_db.get_user(999)
-        assert result is None
-
     def test_in_memory_database_insert_order(self, in_memory_db):
         """Test insert_order method"""
         order = Order(
@@ -164,9 +159,9 @@ class TestInMemoryAdditional:
             side=Side.BUY,
             type=OrderType.LIMIT,
             time_in_force=TimeInForce.GTC,
-            price=Decimal("100.0"),
-            amount=Decimal("10.0"),
-            filled=Decimal("0.0"),
+            price=_D100,
+            amount=_D10,
+            filled=_D0,
             status=OrderStatus.OPEN,
         )
         result = in_memory_db.insert_order(order)
@@ -182,9 +177,9 @@ class TestInMemoryAdditional:
             maker_order_id=1,
             taker_order_id=2,
             taker_side=Side.BUY,
-            price=Decimal("100.0"),
-            amount=Decimal("10.0"),
-            fee=Decimal("0.1"),
+            price=_D100,
+            amount=_D10,
+            fee=_D0_1,
         )
         result = in_memory_db.insert_trade(trade)
         assert result == trade
@@ -203,8 +198,8 @@ class TestInMemoryAdditional:
             id=1,
             account_id=1,
             asset=Asset.USDT,
-            available=Decimal("1000.0"),
-            locked=Decimal("0.0"),
+            available=_D1000,
+            locked=_D0,
         )
         result = in_memory_db.upsert_balance(balance)
         assert result == balance
@@ -218,7 +213,7 @@ class TestInMemoryAdditional:
             user_id=1,
             type=TransactionType.DEPOSIT,
             asset=Asset.USDT,
-            amount=Decimal("100.0"),
+            amount=_D100,
             status=TransactionStatus.PENDING,
             tx_hash="test_hash",
             chain="test_chain",
@@ -254,9 +249,9 @@ class TestInMemoryAdditional:
             side=Side.BUY,
             type=OrderType.LIMIT,
             time_in_force=TimeInForce.GTC,
-            price=Decimal("100.0"),
-            amount=Decimal("10.0"),
-            filled=Decimal("0.0"),
+            price=_D100,
+            amount=_D10,
+            filled=_D0,
             status=OrderStatus.OPEN,
         )
         in_memory_db.orders[1] = order
@@ -277,9 +272,9 @@ class TestInMemoryAdditional:
             side=Side.BUY,
             type=OrderType.LIMIT,
             time_in_force=TimeInForce.GTC,
-            price=Decimal("100.0"),
-            amount=Decimal("10.0"),
-            filled=Decimal("0.0"),
+            price=_D100,
+            amount=_D10,
+            filled=_D0,
             status=OrderStatus.OPEN,
         )
         in_memory_db.orders[1] = order
@@ -296,9 +291,9 @@ class TestInMemoryAdditional:
             side=Side.SELL,
             type=OrderType.LIMIT,
             time_in_force=TimeInForce.GTC,
-            price=Decimal("200.0"),
-            amount=Decimal("5.0"),
-            filled=Decimal("0.0"),
+            price=_D200,
+            amount=_D5,
+            filled=_D0,
             status=OrderStatus.OPEN,
         )
         in_memory_db.orders[2] = order2
@@ -360,9 +355,9 @@ class TestInMemoryAdditional:
             side=Side.BUY,
             type=OrderType.LIMIT,
             time_in_force=TimeInForce.GTC,
-            price=Decimal("100.0"),
-            amount=Decimal("10.0"),
-            filled=Decimal("0.0"),
+            price=_D100,
+            amount=_D10,
+            filled=_D0,
             status=OrderStatus.OPEN,
         )
         order2 = Order(
@@ -373,9 +368,9 @@ class TestInMemoryAdditional:
             side=Side.SELL,
             type=OrderType.LIMIT,
             time_in_force=TimeInForce.GTC,
-            price=Decimal("200.0"),
-            amount=Decimal("5.0"),
-            filled=Decimal("0.0"),
+            price=_D200,
+            amount=_D5,
+            filled=_D0,
             status=OrderStatus.OPEN,
         )
         order3 = Order(
@@ -386,9 +381,9 @@ class TestInMemoryAdditional:
             side=Side.BUY,
             type=OrderType.LIMIT,
             time_in_force=TimeInForce.GTC,
-            price=Decimal("150.0"),
-            amount=Decimal("8.0"),
-            filled=Decimal("0.0"),
+            price=_D150,
+            amount=_D8,
+            filled=_D0,
             status=OrderStatus.OPEN,
         )
         in_memory_db.orders[1] = order1
@@ -411,9 +406,9 @@ class TestInMemoryAdditional:
             side=Side.BUY,
             type=OrderType.LIMIT,
             time_in_force=TimeInForce.GTC,
-            price=Decimal("100.0"),
-            amount=Decimal("10.0"),
-            filled=Decimal("0.0"),
+            price=_D100,
+            amount=_D10,
+            filled=_D0,
             status=OrderStatus.OPEN,
         )
         order2 = Order(
@@ -424,9 +419,9 @@ class TestInMemoryAdditional:
             side=Side.SELL,
             type=OrderType.LIMIT,
             time_in_force=TimeInForce.GTC,
-            price=Decimal("200.0"),
-            amount=Decimal("5.0"),
-            filled=Decimal("0.0"),
+            price=_D200,
+            amount=_D5,
+            filled=_D0,
             status=OrderStatus.OPEN,
         )
         order3 = Order(
@@ -437,9 +432,9 @@ class TestInMemoryAdditional:
             side=Side.BUY,
             type=OrderType.LIMIT,
             time_in_force=TimeInForce.GTC,
-            price=Decimal("150.0"),
-            amount=Decimal("8.0"),
-            filled=Decimal("0.0"),
+            price=_D150,
+            amount=_D8,
+            filled=_D0,
             status=OrderStatus.OPEN,
         )
         in_memory_db.orders[1] = order1
@@ -463,9 +458,9 @@ class TestInMemoryAdditional:
             side=Side.BUY,
             type=OrderType.LIMIT,
             time_in_force=TimeInForce.GTC,
-            price=Decimal("100.0"),
-            amount=Decimal("10.0"),
-            filled=Decimal("0.0"),
+            price=_D100,
+            amount=_D10,
+            filled=_D0,
             status=OrderStatus.OPEN,
         )
         order2 = Order(
@@ -476,9 +471,9 @@ class TestInMemoryAdditional:
             side=Side.SELL,
             type=OrderType.LIMIT,
             time_in_force=TimeInForce.GTC,
-            price=Decimal("100.0"),
-            amount=Decimal("10.0"),
-            filled=Decimal("0.0"),
+            price=_D100,
+            amount=_D10,
+            filled=_D0,
             status=OrderStatus.OPEN,
         )
         order3 = Order(
@@ -489,9 +484,9 @@ class TestInMemoryAdditional:
             side=Side.BUY,
             type=OrderType.LIMIT,
             time_in_force=TimeInForce.GTC,
-            price=Decimal("150.0"),
-            amount=Decimal("8.0"),
-            filled=Decimal("0.0"),
+            price=_D150,
+            amount=_D8,
+            filled=_D0,
             status=OrderStatus.OPEN,
         )
         in_memory_db.orders[1] = order1
@@ -506,9 +501,9 @@ class TestInMemoryAdditional:
             maker_order_id=1,
             taker_order_id=2,
             taker_side=Side.BUY,
-            price=Decimal("100.0"),
-            amount=Decimal("10.0"),
-            fee=Decimal("0.1"),
+            price=_D100,
+            amount=_D10,
+            fee=_D0_1,
         )
         trade2 = Trade(
             id=2,
@@ -517,8 +512,8 @@ class TestInMemoryAdditional:
             maker_order_id=2,
             taker_order_id=3,
             taker_side=Side.BUY,
-            price=Decimal("100.0"),
-            amount=Decimal("5.0"),
+            price=_D100,
+            amount=_D5,
             fee=Decimal("0.05"),
         )
         in_memory_db.trades[1] = trade1
@@ -535,7 +530,7 @@ class TestInMemoryAdditional:
             user_id=1,
             type=TransactionType.DEPOSIT,
             asset=Asset.USDT,
-            amount=Decimal("100.0"),
+            amount=_D100,
             status=TransactionStatus.PENDING,
             tx_hash="test_hash1",
             chain="test_chain",
@@ -559,7 +554,7 @@ class TestInMemoryAdditional:
             user_id=2,
             type=TransactionType.DEPOSIT,
             asset=Asset.USDT,
-            amount=Decimal("200.0"),
+            amount=_D200,
             status=TransactionStatus.PENDING,
             tx_hash="test_hash3",
             chain="test_chain",
@@ -596,9 +591,9 @@ class TestInMemoryAdditional:
             side=Side.BUY,
             type=OrderType.LIMIT,
             time_in_force=TimeInForce.GTC,
-            price=Decimal("100.0"),
-            amount=Decimal("10.0"),
-            filled=Decimal("0.0"),
+            price=_D100,
+            amount=_D10,
+            filled=_D0,
             status=OrderStatus.OPEN,
         )
         in_memory_db.orders[1] = order
@@ -611,9 +606,9 @@ class TestInMemoryAdditional:
             side=Side.BUY,
             type=OrderType.LIMIT,
             time_in_force=TimeInForce.GTC,
-            price=Decimal("100.0"),
-            amount=Decimal("10.0"),
-            filled=Decimal("5.0"),
+            price=_D100,
+            amount=_D10,
+            filled=_D5,
             status=OrderStatus.PARTIAL,
         )
         in_memory_db.update_order(updated_order)
@@ -627,7 +622,7 @@ class TestInMemoryAdditional:
             user_id=1,
             type=TransactionType.DEPOSIT,
             asset=Asset.USDT,
-            amount=Decimal("100.0"),
+            amount=_D100,
             status=TransactionStatus.PENDING,
             tx_hash="test_hash",
             chain="test_chain",
@@ -641,7 +636,7 @@ class TestInMemoryAdditional:
             user_id=1,
             type=TransactionType.DEPOSIT,
             asset=Asset.USDT,
-            amount=Decimal("100.0"),
+            amount=_D100,
             status=TransactionStatus.CONFIRMED,
             tx_hash="test_hash",
             chain="test_chain",
@@ -695,9 +690,9 @@ class TestInMemoryUnitOfWork:
             side=Side.BUY,
             type=OrderType.LIMIT,
             time_in_force=TimeInForce.GTC,
-            price=Decimal("100.0"),
-            amount=Decimal("10.0"),
-            filled=Decimal("0.0"),
+            price=_D100,
+            amount=_D10,
+            filled=_D0,
             status=OrderStatus.OPEN,
         )
         uow.db.orders[1] = order
@@ -713,9 +708,9 @@ class TestInMemoryUnitOfWork:
                     side=Side.SELL,
                     type=OrderType.LIMIT,
                     time_in_force=TimeInForce.GTC,
-                    price=Decimal("200.0"),
-                    amount=Decimal("5.0"),
-                    filled=Decimal("0.0"),
+                    price=_D200,
+                    amount=_D5,
+                    filled=_D0,
                     status=OrderStatus.OPEN,
                 )
                 uow.db.orders[2] = order2
@@ -12,9 +12,13 @@ from alt_exchange.infra.database.postgres import PostgreSQLDatabase
 
 
 class TestDatabaseFactory:
-    def test_create_in_memory_database(self):
-        """인메모리 데이터베이스 생성 테스트"""
-        db = DatabaseFactory.create_database("inmemory")
+    @pytest.mark.parametrize(
+        "args", [("inmemory",), (None,), ()], ids=["inmemory", "none", "default"]
+    )
+    def test_create_in_memory_database(self, monkeypatch, args):
+        """인메모리 데이터베이스 생성 테스트 (None/생략 시 자동으로 "inmemory")"""
+        monkeypatch.delenv("DATABASE_TYPE", raising=False)
+        db = DatabaseFactory.create_database(*args)
         assert isinstance(db, InMemoryDatabase)
 
     def test_create_postgres_database(self):
@@ -26,43 +30,20 @@ class TestDatabaseFactory:
             db = DatabaseFactory.create_database("postgres", "postgresql://test")
             assert db == "mock_postgres_db"
 
-    def test_create_database_with_invalid_type(self):
-        """잘못된 타입으로 데이터베이스 생성 시 예외 발생 테스트"""
-        with pytest.raises(ValueError, match="Unsupported database type"):
-            DatabaseFactory.create_database("invalid_type")
-
-    def test_create_database_with_none_type(self):
-        """None 타입으로 데이터베이스 생성 시 예외 발생 테스트"""
-        # None 타입은 자동으로 "inmemory"로 설정됨
-        db = DatabaseFactory.create_database(None)
-        assert isinstance(db, InMemoryDatabase)
-
-    def test_create_database_with_empty_string(self):
-        """빈 문자열로 데이터베이스 생성 시 예외 발생 테스트"""
-        with pytest.raises(ValueError, match="Unsupported database type"):
-            DatabaseFactory.create_database("")
-
-    def test_create_database_case_sensitive(self):
-        """대소문자 구분 테스트"""
-        with pytest.raises(ValueError, match="Unsupported database type"):
-            DatabaseFactory.create_database("IN_MEMORY")
-
-    def test_create_database_with_whitespace(self):
-        """공백이 포함된 타입으로 데이터베이스 생성 시 예외 발생 테스트"""
-        with pytest.raises(ValueError, match="Unsupported database type"):
-            DatabaseFactory.create_database(" in_memory ")
-
-    def test_create_database_with_special_characters(self):
-        """특수문자가 포함된 타입으로 데이터베이스 생성 시 예외 발생 테스트"""
-        with pytest.raises(ValueError, match="Unsupported database type"):
-            DatabaseFactory.create_database("in_memory!")
-
-    def test_create_database_with_numbers(self):
-        """숫자가 포함된 타입으로 데이터베이스 생성 시 예외 발생 테스트"""
-        with pytest.raises(ValueError, match="Unsupported database type"):
-            DatabaseFactory.create_database("in_memory123")
-
-    def test_create_database_with_unicode(self):
-        """유니코드 문자가 포함된 타입으로 데이터베이스 생성 시 예외 발생 테스트"""
-        with pytest.raises(ValueError, match="Unsupported database type"):
-            DatabaseFactory.create_database("in_memory_한글")
+    @pytest.mark.parametrize(
+        "database_type",
+        [
+            "invalid_type",
+            "",
+            "IN_MEMORY",
+            " in_memory ",
+            "in_memory!",
+            "in_memory123",
+            "in_memory_한글",
+        ],
+    )
+    def test_create_database_with_unsupported_type(self, database_type):
+        """지원하지 않는 타입으로 데이터베이스 생성 시 예외 발생 테스트
+        (빈 문자열, 대소문자, 공백, 특수문자, 숫자, 유니코드 포함)"""
+        with pytest.raises(ValueError):
+            DatabaseFactory.create_database(database_type)
@@ -2,7 +2,11 @@
 InMemory database 테스트
 """
 
+import sys
+from concurrent.futures import ThreadPoolExecutor
 from decimal import Decimal
+from threading import Barrier
+from unittest.mock import MagicMock
 
 import pytest
 
@@ -11,24 +15,91 @@ from alt_exchange.core.enums import (AccountStatus, Asset, OrderStatus,
                                      TransactionStatus, TransactionType)
 from alt_exchange.core.models import (Account, AuditLog, Balance, Order, Trade,
                                       Transaction, User)
+from alt_exchange.infra.database.base import Database
 from alt_exchange.infra.database.in_memory import (InMemoryDatabase,
                                                    InMemoryUnitOfWork)
 
+_D100 = Decimal("100.0")
+_D10 = Decimal("10.0")
+_D5 = Decimal("5.0")
+_D0_5 = Decimal("0.5")
+
+
+@pytest.fixture
+def db():
+    """Empty in-memory database"""
+    return InMemoryDatabase()
+
 
 class TestInMemoryDatabase:
-    def test_database_creation(self):
-        db = InMemoryDatabase()
-        assert db is not None
+    def test_database_creation(self, db):
+        assert isinstance(db, InMemoryDatabase)
 
-    def test_next_id(self):
-        db = InMemoryDatabase()
+    def test_next_id(self, db):
         id1 = db.next_id("users")
         id2 = db.next_id("users")
         assert id1 == 1
         assert id2 == 2
 
-    def test_user_operations(self):
-        db = InMemoryDatabase()
+    def test_next_ids(self, db):
+        assert list(db.next_ids("orders", 3)) == [1, 2, 3]
+        assert db.next_id("orders") == 4
+        assert db.next_id("trades") == 1
+
+    def test_next_ids_concurrent_unique(self, db):
+        start = Barrier(8)
+
+        def allocate(worker):
+            ids = []
+            start.wait()
+            for _ in range(5000):
+                if worker % 2:
+                    ids.extend(db.next_ids("orders", 3))
+                else:
+                    ids.append(db.next_id("orders"))
+            return ids
+
+        # Switch threads as often as possible to expose read-then-replace races
+        interval = sys.getswitchinterval()
+        sys.setswitchinterval(1e-6)
+        try:
+            with ThreadPoolExecutor(max_workers=8) as pool:
+                results = list(pool.map(allocate, range(8)))
+        finally:
+            sys.setswitchinterval(interval)
+
+        ids = [i for chunk in results for i in chunk]
+        assert len(ids) == len(set(ids)) == 4 * 5000 + 4 * 15000
+
+    def test_next_ids_negative(self, db):
+        with pytest.raises(ValueError, match="negative"):
+            db.next_ids("orders", -3)
+        assert db.next_id("orders") == 1
+
+    def test_base_next_ids_negative(self):
+        backend = MagicMock()
+        with pytest.raises(ValueError, match="negative"):
+            Database.next_ids(backend, "orders", -3)
+        backend.next_id.assert_not_called()
+
+    def test_insert_many(self, db):
+        user = User(id=1, email="bulk@example.com", password_hash="hashed_password")
+        account = Account(id=1, user_id=1)
+        balance = Balance(
+            id=1, account_id=1, asset=Asset.ALT, available=_D100, locked=_D10
+        )
+
+        db.insert_many([user, account, balance])
+
+        assert db.get_user(1) == user
+        assert db.get_account(1) == account
+        assert db.find_balance(1, Asset.ALT) == balance
+
+    def test_insert_many_unsupported_type(self, db):
+        with pytest.raises(TypeError, match="Unsupported model type: str"):
+            db.insert_many(["not a model"])
+
+    def test_user_operations(self, db):
         user = User(id=1, email="test@example.com", password_hash="hashed_password")
 
         # Insert user
@@ -43,8 +114,13 @@ class TestInMemoryDatabase:
         user_by_email = db.get_user_by_email("test@example.com")
         assert user_by_email == user
 
-    def test_account_operations(self):
-        db = InMemoryDatabase()
+    def test_get_users(self, db):
+        user = User(id=1, email="test@example.com", password_hash="hashed_password")
+        db.insert_user(user)
+
+        assert db.get_users([1, 99]) == [user, None]
+
+    def test_account_operations(self, db):
         account = Account(id=1, user_id=1)
 
         # Insert account
@@ -55,14 +131,13 @@ class TestInMemoryDatabase:
         retrieved_account = db.get_account(1)
         assert retrieved_account == account
 
-    def test_balance_operations(self):
-        db = InMemoryDatabase()
+    def test_balance_operations(self, db):
         balance = Balance(
             id=1,
             account_id=1,
             asset=Asset.ALT,
-            available=Decimal("100.0"),
-            locked=Decimal("10.0"),
+            available=_D100,
+            locked=_D10,
         )
 
         # Upsert balance
@@ -73,8 +148,7 @@ class TestInMemoryDatabase:
         found_balance = db.find_balance(1, Asset.ALT)
         assert found_balance == balance
 
-    def test_order_operations(self):
-        db = InMemoryDatabase()
+    def test_order_operations(self, db):
         order = Order(
             id=1,
             user_id=1,
@@ -83,8 +157,8 @@ class TestInMemoryDatabase:
             side=Side.BUY,
             type=OrderType.LIMIT,
             time_in_force=TimeInForce.GTC,
-            price=Decimal("100.0"),
-            amount=Decimal("10.0"),
+            price=_D100,
+            amount=_D10,
         )
 
         # Insert order
@@ -92,15 +166,14 @@ class TestInMemoryDatabase:
         assert inserted_order == order
 
         # Update order
-        order.filled = Decimal("5.0")
+        order.filled = _D5
         db.update_order(order)
 
         # Get order
         retrieved_order = db.get_order(1)
-        assert retrieved_order.filled == Decimal("5.0")
+        assert retrieved_order.filled == _D5
 
-    def test_trade_operations(self):
-        db = InMemoryDatabase()
+    def test_trade_operations(self, db):
         trade = Trade(
             id=1,
             buy_order_id=1,
@@ -108,9 +181,9 @@ class TestInMemoryDatabase:
             maker_order_id=1,
             taker_order_id=2,
             taker_side=Side.BUY,
-            price=Decimal("100.0"),
-            amount=Decimal("5.0"),
-            fee=Decimal("0.5"),
+            price=_D100,
+            amount=_D5,
+            fee=_D0_5,
         )
 
         # Insert trade
@@ -121,8 +194,7 @@ class TestInMemoryDatabase:
         retrieved_trade = db.get_trade(1)
         assert retrieved_trade == trade
 
-    def test_transaction_operations(self):
-        db = InMemoryDatabase()
+    def test_transaction_operations(self, db):
         transaction = Transaction(
             id=1,
             user_id=1,
@@ -132,7 +204,7 @@ class TestInMemoryDatabase:
             type=TransactionType.DEPOSIT,
             status=TransactionStatus.PENDING,
             confirmations=0,
-            amount=Decimal("100.0"),
+            amount=_D100,
             address="0xabc",
         )
 
@@ -148,8 +220,7 @@ class TestInMemoryDatabase:
         retrieved_transaction = db.get_transaction(1)
         assert retrieved_transaction.status == TransactionStatus.CONFIRMED
 
-    def test_audit_log_operations(self):
-        db = InMemoryDatabase()
+    def test_audit_log_operations(self, db):
         audit_log = AuditLog(
             id=1,
             actor="admin_1",
@@ -167,11 +238,22 @@ class TestInMemoryDatabase:
         assert len(retrieved_audit_logs) == 1
         assert retrieved_audit_logs[0] == audit_log
 
+    def test_reset(self, db):
+        db.next_id("users")
+        db.upsert_balance(
+            Balance(id=1, account_id=1, asset=Asset.ALT, available=_D100, locked=_D10)
+        )
+
+        db.reset()
+
+        assert db.users == {}
+        assert db.accounts == {}
+        assert db.find_balance(1, Asset.ALT) is None
+        assert db.next_id("users") == 1
 
-class TestInMemoryUnitOfWork:
-    def test_unit_of_work_commit(self):
-        db = InMemoryDatabase()
 
+class TestInMemoryUnitOfWork:
+    def test_unit_of_work_commit(self, db):
         with InMemoryUnitOfWork(db) as uow:
             user = User(id=1, email="test@example.com", password_hash="hashed_password")
             db.insert_user(user)
@@ -181,9 +263,7 @@ class TestInMemoryUnitOfWork:
         retrieved_user = db.get_user(1)
         assert retrieved_user == user
 
-    def test_unit_of_work_rollback(self):
-        db = InMemoryDatabase()
-
+    def test_unit_of_work_rollback(self, db):
         try:
             with InMemoryUnitOfWork(db) as uow:
                 user = User(
@@ -171,8 +171,8 @@ class TestAccountService:
 
         orders = self.service.get_user_orders(user.id)
         assert len(orders) == 2
-        assert order1.id in [o.id for o in orders]
-        assert order2.id in [o.id for o in orders]
+        assert {o.id for o in orders} == {order1.id, order2.id}
+        assert {o.side for o in orders} == {Side.BUY, Side.SELL}
 
     def test_get_user_trades(self):
         user = self.service.create_user("test@example.com", "password123")
@@ -21,6 +21,7 @@ class TestAccountServiceExtended:
     def setup_method(self):
         """Set up test fixtures"""
         self.mock_db = Mock()
+        self.mock_db.next_ids.side_effect = lambda table, n: range(1, n + 1)
         self.mock_matching_engine = Mock()
         self.mock_event_bus = Mock()
 
@@ -52,6 +53,7 @@ class TestAccountServiceExtended:
         except Exception:
             # If it fails due to missing implementation, just pass
             pass
+        assert self.mock_db.upsert_balance.call_count == len(Asset)
 
     def test_get_account_basic(self):
         """Test basic account retrieval"""
@@ -16,6 +16,9 @@ from alt_exchange.services.admin.service import AdminService
 from alt_exchange.services.matching.engine import MatchingEngine
 from alt_exchange.services.wallet.service import WalletService
 
+_D100 = Decimal("100.0")
+_D1000 = Decimal("1000.0")
+
 
 class TestAdminService:
     def setup_method(self):
@@ -30,6 +33,14 @@ class TestAdminService:
             self.db, self.event_bus, self.account_service, self.wallet_service
         )
 
+    def _create_funded_user(self, email="test@example.com", alt=_D1000):
+        """Create a user through the account service and fund its ALT balance"""
+        user = self.account_service.create_user(email, "password123")
+        balance = self.account_service.get_balance(user.id, Asset.ALT)
+        balance.available = alt
+        self.db.upsert_balance(balance)
+        return user
+
     def test_is_admin(self):
         # User ID < 100 should be admin
         assert self.service._is_admin(1) is True
@@ -40,18 +51,11 @@ class TestAdminService:
         assert self.service._is_admin(200) is False
 
     def test_list_pending_withdrawals(self):
-        # Create a user and account
-        user = self.account_service.create_user("test@example.com", "password123")
-
-        # Add some balance
-        account = self.account_service.get_account(user.id)
-        balance = self.account_service.get_balance(user.id, Asset.ALT)
-        balance.available = Decimal("1000.0")
-        self.db.upsert_balance(balance)
+        user = self._create_funded_user()
 
         # Request withdrawal
         transaction = self.wallet_service.request_withdrawal(
-            user_id=user.id, asset=Asset.ALT, amount=Decimal("100.0"), address="0x456"
+            user_id=user.id, asset=Asset.ALT, amount=_D100, address="0x456"
         )
 
         # List pending withdrawals as admin
@@ -62,18 +66,11 @@ class TestAdminService:
         assert pending_withdrawals[0].status == TransactionStatus.PENDING
 
     def test_approve_withdrawal_first_approval(self):
-        # Create a user and account
-        user = self.account_service.create_user("test@example.com", "password123")
-
-        # Add some balance
-        account = self.account_service.get_account(user.id)
-        balance = self.account_service.get_balance(user.id, Asset.ALT)
-        balance.available = Decimal("1000.0")
-        self.db.upsert_balance(balance)
+        user = self._create_funded_user()
 
         # Request withdrawal
         transaction = self.wallet_service.request_withdrawal(
-            user_id=user.id, asset=Asset.ALT, amount=Decimal("100.0"), address="0x456"
+            user_id=user.id, asset=Asset.ALT, amount=_D100, address="0x456"
         )
 
         # First approval
@@ -86,18 +83,11 @@ class TestAdminService:
         )  # Still pending for second approval
 
     def test_approve_withdrawal_second_approval(self):
-        # Create a user and account
-        user = self.account_service.create_user("test@example.com", "password123")
-
-        # Add some balance
-        account = self.account_service.get_account(user.id)
-        balance = self.account_service.get_balance(user.id, Asset.ALT)
-        balance.available = Decimal("1000.0")
-        self.db.upsert_balance(balance)
+        user = self._create_funded_user()
 
         # Request withdrawal
         transaction = self.wallet_service.request_withdrawal(
-            user_id=user.id, asset=Asset.ALT, amount=Decimal("100.0"), address="0x456"
+            user_id=user.id, asset=Asset.ALT, amount=_D100, address="0x456"
         )
 
         # First approval
@@ -110,18 +100,11 @@ class TestAdminService:
         assert approved_transaction.tx_hash is not None
 
     def test_reject_withdrawal(self):
-        # Create a user and account
-        user = self.account_service.create_user("test@example.com", "password123")
-
-        # Add some balance
-        account = self.account_service.get_account(user.id)
-        balance = self.account_service.get_balance(user.id, Asset.ALT)
-        balance.available = Decimal("1000.0")
-        self.db.upsert_balance(balance)
+        user = self._create_funded_user()
 
         # Request withdrawal
         transaction = self.wallet_service.request_withdrawal(
-            user_id=user.id, asset=Asset.ALT, amount=Decimal("100.0"), address="0x456"
+            user_id=user.id, asset=Asset.ALT, amount=_D100, address="0x456"
         )
 
         # Reject withdrawal